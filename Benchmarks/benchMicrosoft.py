@@ -0,0 +1,141 @@
+"""
+Microsoft status page: streaming keyword extractor vs. full BeautifulSoup scrape.
+
+    py -m Benchmarks.benchMicrosoft            # all snapshots in Benchmarks/snapshots/microsoft*.html
+    py -m Benchmarks.benchMicrosoft --save     # capture the live page as a new snapshot first
+
+With no saved snapshots a synthetic page is generated so the script always runs.
+Reports CPU time per parse and peak traced memory for each path, and checks both
+paths produce the same ticker segment, also when every incident line is split
+across a chunk boundary.
+"""
+import argparse
+import glob
+import os
+import time
+import tracemalloc
+
+from Utility import statusSources
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), "snapshots")
+CHUNK = 16384
+SPEC = next(s for s in statusSources.PROVIDERS if s["name"] == "Microsoft Cloud")
+
+
+def synthetic_page(rows: int = 4000) -> bytes:
+    parts = ["<html><head><title>Microsoft status</title><style>.x{color:red}</style></head><body>",
+             "<script>var outage = 'not visible text';</script>",
+             "<div class='banner'>All systems operational</div><ul>"]
+    for i in range(rows):
+        parts.append(f"<li><span>Service {i}</span> <b>Available</b> <a href='/s/{i}'>details</a></li>")
+    parts.append("<div role='alert'>Exchange Online: degraded mail flow in North America</div>")
+    parts.append("</ul></body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def load_pages():
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(SNAPSHOT_DIR, "microsoft*.html"))):
+        with open(path, "rb") as f:
+            pages[os.path.basename(path)] = f.read()
+    if not pages:
+        pages["synthetic"] = synthetic_page()
+    return pages
+
+
+def save_live_snapshot():
+    import requests
+
+    r = requests.get(SPEC["url"], timeout=statusSources.TIMEOUT)
+    r.raise_for_status()
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    path = os.path.join(SNAPSHOT_DIR, time.strftime("microsoft-%Y%m%d-%H%M%S.html"))
+    with open(path, "wb") as f:
+        f.write(r.content)
+    print(f"saved {path} ({len(r.content)} bytes)")
+
+
+class _Page:
+    """The bits of a streamed requests.Response that the parsers use."""
+
+    encoding = "utf-8"
+
+    def __init__(self, page: bytes, bounds):
+        self._page = page
+        self._bounds = bounds
+
+    def iter_content(self, chunk_size=None):
+        for a, b in zip(self._bounds, self._bounds[1:]):
+            yield self._page[a:b]
+
+    @property
+    def text(self) -> str:
+        return self._page.decode(self.encoding, errors="replace")
+
+
+def run_fast(page: bytes, cuts=()):
+    # _parse_html as fetched: 16 KB chunks, plus extra boundaries at `cuts`
+    bounds = sorted(set(range(0, len(page), CHUNK)) | set(cuts)) + [len(page)]
+    return statusSources._parse_html(_Page(page, bounds), SPEC)
+
+
+def split_line_cuts(page: bytes) -> list[int]:
+    # the middle of every line the reference scrape matched, so each crosses a chunk boundary
+    cuts = []
+    for ln in statusSources._html_lines_soup(page.decode("utf-8", errors="replace")):
+        raw = ln.encode("utf-8")
+        i = page.find(raw)
+        if i >= 0 and any(k in ln.lower() for k in statusSources._html_keywords(SPEC)):
+            cuts.append(i + len(raw) // 2)
+    return cuts
+
+
+def run_soup(page: bytes):
+    return statusSources._parse_html_soup(_Page(page, [0, len(page)]), SPEC)
+
+
+def measure(fn, page: bytes, repeat: int):
+    fn(page)  # warm up imports/caches
+
+    cpu0 = time.process_time()
+    for _ in range(repeat):
+        result = fn(page)
+    cpu = (time.process_time() - cpu0) / repeat
+
+    tracemalloc.start()
+    fn(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, cpu, peak
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--save", action="store_true", help="capture the live page as a snapshot first")
+    ap.add_argument("--repeat", type=int, default=10)
+    args = ap.parse_args()
+
+    if args.save:
+        save_live_snapshot()
+
+    print(f"{'snapshot':<32}{'bytes':>10}{'path':>8}{'cpu ms':>10}{'peak KiB':>11}")
+    for name, page in load_pages().items():
+        results = {}
+        for label, fn in (("soup", run_soup), ("fast", run_fast)):
+            seg, cpu, peak = measure(fn, page, args.repeat)
+            results[label] = (seg, cpu, peak)
+            print(f"{name:<32}{len(page):>10}{label:>8}{cpu * 1000:>10.2f}{peak / 1024:>11.1f}")
+
+        (soup_seg, soup_cpu, soup_peak), (fast_seg, fast_cpu, fast_peak) = results["soup"], results["fast"]
+        split_seg = run_fast(page, split_line_cuts(page))
+        if soup_seg != fast_seg:
+            same = f"MISMATCH: {soup_seg!r} vs {fast_seg!r}"
+        elif soup_seg != split_seg:
+            same = f"MISMATCH with split lines: {soup_seg!r} vs {split_seg!r}"
+        else:
+            same = "same segment"
+        print(f"  -> {soup_cpu / max(fast_cpu, 1e-9):.1f}x cpu, {soup_peak / max(fast_peak, 1):.1f}x peak memory, {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Startup cost of the overlay: import time and time-to-first-frame.
+
+    py -m Benchmarks.benchStartup                 # 5 cold launches, median/max
+    py -m Benchmarks.benchStartup --runs 10 --content
+    py -m Benchmarks.benchStartup --top 15        # biggest imports (python -X importtime)
+
+Every run is a fresh interpreter, like a logon-script launch. Reported per run:
+  - import_ms:        `import GUI.tickerOverlay`
+  - first_frame_ms:   process start -> bar window mapped and painted
+  - first_content_ms: process start -> first ticker lap drawn (--content; feeds
+                      served by Benchmarks.stubServer so the network doesn't count)
+  - deferred:         heavy modules still NOT imported at first frame (should be all)
+Each run gets an empty data folder, so no warm-start snapshot or response
+cache carries over and the user's own %LOCALAPPDATA%\StatusTicker is untouched.
+Needs a desktop session (Windows for the AppBar).
+"""
+import argparse
+import json
+import statistics
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# modules the bar must not need before it is painted
+HEAVY_MODULES = ("requests", "bs4", "PIL", "http.server")
+CONTENT_TIMEOUT_SECONDS = 30
+
+
+def child(started: float, content: bool):
+    # Runs inside the measured interpreter; prints one JSON line.
+    # A throwaway data folder (Utility.appPaths reads LOCALAPPDATA): the real
+    # last_status.json would be drawn as a warm start, and stub results must
+    # not be saved over it.
+    data = tempfile.mkdtemp(prefix="ticker-bench-")
+    os.environ["LOCALAPPDATA"] = data
+
+    t0 = time.perf_counter()
+    from GUI.tickerOverlay import TickerOverlay
+    import_ms = (time.perf_counter() - t0) * 1000
+
+    stub = None
+    if content:
+        import GUI.uiConfig as ui
+        from Benchmarks.stubServer import StubServer
+
+        ui.HISTORY_ENABLED = False  # stub transitions under real provider names aren't history
+        stub = StubServer("typical").__enter__()
+        stub.pointed_at().__enter__()
+
+    app = TickerOverlay()
+    app.update()  # map + paint the bar
+    first_frame_ms = (time.time() - started) * 1000
+    deferred = [m for m in HEAVY_MODULES if m not in sys.modules]
+
+    first_content_ms = None
+    if content:
+        deadline = time.monotonic() + CONTENT_TIMEOUT_SECONDS
+        while not app.bars[0]._laps and time.monotonic() < deadline:
+            app.update()
+            time.sleep(0.005)
+        if app.bars[0]._laps:
+            first_content_ms = (time.time() - started) * 1000
+
+    app._close()
+    shutil.rmtree(data, ignore_errors=True)
+    print(json.dumps({"import_ms": import_ms, "first_frame_ms": first_frame_ms,
+                      "first_content_ms": first_content_ms, "deferred": deferred}))
+
+
+def launch(content: bool) -> dict:
+    cmd = [sys.executable, "-m", "Benchmarks.benchStartup", "--child", "--started", repr(time.time())]
+    if content:
+        cmd.append("--content")
+    out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def top_imports(n: int):
+    # cumulative microseconds per module, from a cold `python -X importtime`
+    err = subprocess.run([sys.executable, "-X", "importtime", "-c", "import GUI.tickerOverlay"],
+                         capture_output=True, text=True, check=True).stderr
+    rows = []
+    for line in err.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    for cumulative, name in sorted(rows, reverse=True)[:n]:
+        print(f"{cumulative / 1000:>9.1f} ms  {name}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Overlay startup benchmark")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--content", action="store_true", help="also time the first drawn lap (stub feeds)")
+    ap.add_argument("--top", type=int, metavar="N", help="list the N slowest imports and exit")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    ap.add_argument("--started", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        child(float(args.started), args.content)
+        return
+    if args.top:
+        top_imports(args.top)
+        return
+
+    runs = [launch(args.content) for _ in range(args.runs)]
+    for key in ("import_ms", "first_frame_ms", "first_content_ms"):
+        values = [r[key] for r in runs if r[key] is not None]
+        if values:
+            print(f"{key:<18} median {statistics.median(values):8.1f}   max {max(values):8.1f}")
+
+    loaded = sorted({m for r in runs for m in HEAVY_MODULES if m not in r["deferred"]})
+    print("heavy imports before first frame:", ", ".join(loaded) if loaded else "none")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Offline benchmark suite for the refresh pipeline.
+
+    py -m Benchmarks.benchSuite                          # all sizes -> bench_results.json
+    py -m Benchmarks.benchSuite --sizes typical --repeat 20
+    py -m Benchmarks.benchSuite --compare old.json       # print % change vs. an earlier run
+    py -m Benchmarks.benchSuite --record                 # save live feeds as "typical" fixtures
+
+Everything runs against Benchmarks.stubServer on 127.0.0.1, so results don't
+depend on the network. Payloads are the deterministic synthetic ones from
+Benchmarks/fixtures.py unless a recording is committed under
+Benchmarks/fixtures/ (see --record). Each result notes which payload it used
+(fixtures.payload_id(): a recording's sha1, or a digest of the generator's
+output), and --compare warns when two runs measured different payloads.
+No recordings ship, so by default every number is for synthetic payloads;
+--record only captures the "typical" size.
+Measures per size (small / typical / large):
+  - e2e:        build_segments() wall time over the stub (median, p95, min) + peak memory;
+                steady state, so feed entries are already memoized (see _entry_memo)
+  - parse:      CPU time and peak memory of each provider's parser alone, cold
+                (entry and classifier memos cleared) and memoized (memo_cpu_ms)
+  - classifier: statusSources.classify() throughput, cold and memoized
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from Benchmarks import fixtures
+from Benchmarks.stubServer import PROVIDER_FIXTURES, StubServer
+from Utility import statusSources
+from Utility.httpCache import HttpCache
+
+DEFAULT_OUT = "bench_results.json"
+
+# fixture key -> built-in provider spec (from the statusSources registry)
+SPECS = {key: next(s for s in statusSources.PROVIDERS if s["name"] == name)
+         for name, key in PROVIDER_FIXTURES.items()}
+KIND_PARSERS = {
+    "statuspage": statusSources._parse_statuspage,  # full summary.json, i.e. the probe's slow path
+    "atom": statusSources._parse_feed,
+    "rss": statusSources._parse_feed,
+    "html": statusSources._parse_html,
+}
+PARSERS = {key: (lambda r, spec=spec: KIND_PARSERS[spec["kind"]](r, spec)) for key, spec in SPECS.items()}
+LIVE_URLS = {key: spec["base"].rstrip("/") + "/api/v2/summary.json" if spec["kind"] == "statuspage" else spec["url"]
+             for key, spec in SPECS.items()}
+
+
+class _Payload:
+    """Just enough of requests.Response over in-memory bytes to time a parser alone."""
+
+    def __init__(self, body: bytes, content_type: str):
+        self._body = body
+        self.encoding = "utf-8"
+        self.headers = {"Content-Type": content_type, "Content-Length": str(len(body))}
+        self.raw = io.BytesIO(body)
+
+    @property
+    def content(self):
+        return self._body
+
+    @property
+    def text(self):
+        return self._body.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self._body)
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i:i + chunk_size]
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _summary(samples):
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {"median_ms": statistics.median(ordered) * 1000, "p95_ms": p95 * 1000, "min_ms": ordered[0] * 1000}
+
+
+def bench_parsers(size: str, repeat: int) -> dict:
+    out = {}
+    for provider, parse in PARSERS.items():
+        body, recorded = fixtures.load(provider, size)
+        ctype = fixtures.CONTENT_TYPES[provider]
+        parse(_Payload(body, ctype))  # warm up
+
+        def cold():
+            statusSources._entry_memo.clear()  # classify every entry, as on a first poll
+            statusSources._get_classifier().classify.cache_clear()
+            parse(_Payload(body, ctype))
+
+        cpu0 = time.process_time()
+        for _ in range(repeat):
+            cold()
+        cpu = (time.process_time() - cpu0) / repeat
+
+        parse(_Payload(body, ctype))  # memo filled: only id + stamp lookups left
+        cpu0 = time.process_time()
+        for _ in range(repeat):
+            parse(_Payload(body, ctype))
+        memo_cpu = (time.process_time() - cpu0) / repeat
+
+        out[provider] = {
+            "bytes": len(body),
+            "recorded": recorded,
+            "payload": fixtures.payload_id(provider, size),
+            "cpu_ms": cpu * 1000,
+            "memo_cpu_ms": memo_cpu * 1000,
+            "peak_kib": _peak_bytes(cold) / 1024,
+        }
+    return out
+
+
+def bench_e2e(size: str, repeat: int) -> dict:
+    with StubServer(size) as stub, stub.pointed_at():
+        statusSources.build_segments()  # warm up connections/imports
+
+        walls = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            statusSources.build_segments()
+            walls.append(time.perf_counter() - t0)
+
+        out = _summary(walls)
+        out["peak_kib"] = _peak_bytes(statusSources.build_segments) / 1024
+        out["bytes_per_refresh"] = stub.bytes_served / (repeat + 2)
+    return out
+
+
+def bench_classifier(size: str) -> dict:
+    n = fixtures.COUNTS[size] * 20
+    texts = [f"Service {i}: users in {'North America' if i % 2 else 'Europe'} see degraded mail flow"
+             for i in range(n)]
+
+    statusSources.set_region_profile(statusSources.REGION_PROFILE)  # fresh, empty memo cache
+    t0 = time.perf_counter()
+    for t in texts:
+        statusSources.classify(t)
+    cold = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for t in texts:
+        statusSources.classify(t)
+    warm = time.perf_counter() - t0
+
+    return {"texts": n, "cold_per_sec": n / max(cold, 1e-9), "memo_per_sec": n / max(warm, 1e-9)}
+
+
+def run(sizes, repeat: int) -> dict:
+    # private cache file, so every refresh really downloads and parses
+    saved_cache = statusSources.http_cache
+    statusSources.http_cache = HttpCache(os.path.join(tempfile.mkdtemp(), "bench_cache.json"))
+    try:
+        results = {}
+        for size in sizes:
+            print(f"[{size}] parsers…", flush=True)
+            parse = bench_parsers(size, repeat)
+            print(f"[{size}] end-to-end…", flush=True)
+            e2e = bench_e2e(size, repeat)
+            print(f"[{size}] classifier…", flush=True)
+            results[size] = {"e2e": e2e, "parse": parse, "classifier": bench_classifier(size)}
+    finally:
+        statusSources.http_cache = saved_cache
+
+    return {
+        "meta": {
+            "when": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _flatten(d, prefix=""):
+    for k, v in d.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict):
+            yield from _flatten(v, key + ".")
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            yield key, v
+
+
+def _payloads(run: dict) -> dict:
+    # (size, provider) -> fixtures.payload_id()
+    return {(size, provider): p.get("payload")
+            for size, r in run.get("results", {}).items() for provider, p in r.get("parse", {}).items()}
+
+
+def compare(old: dict, new: dict):
+    old_payloads, new_payloads = _payloads(old), _payloads(new)
+    differ = sorted(f"{provider}-{size}" for (size, provider), digest in new_payloads.items()
+                    if old_payloads.get((size, provider)) != digest)
+    if differ:
+        print(f"warning: payloads differ between the runs ({', '.join(differ)}); "
+              f"those numbers aren't comparable")
+
+    before = dict(_flatten(old.get("results", {})))
+    print(f"{'metric':<48}{'before':>12}{'after':>12}{'change':>9}")
+    for key, after in _flatten(new["results"]):
+        if key not in before:
+            continue
+        prev = before[key]
+        change = (after - prev) / prev * 100 if prev else 0.0
+        print(f"{key:<48}{prev:>12.2f}{after:>12.2f}{change:>8.1f}%")
+
+
+def record():
+    # commit the files this writes: every checkout then benchmarks the same payloads
+    import requests
+
+    os.makedirs(fixtures.FIXTURE_DIR, exist_ok=True)
+    for provider, url in LIVE_URLS.items():
+        r = requests.get(url, timeout=statusSources.TIMEOUT)
+        r.raise_for_status()
+        path = fixtures.fixture_path(provider, "typical")
+        with open(path, "wb") as f:
+            f.write(r.content)
+        print(f"recorded {path} ({len(r.content)} bytes)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Offline benchmarks for the status pipeline")
+    ap.add_argument("--sizes", nargs="+", choices=fixtures.SIZES, default=list(fixtures.SIZES))
+    ap.add_argument("--repeat", type=int, default=10)
+    ap.add_argument("--out", default=DEFAULT_OUT, help=f"results file (default {DEFAULT_OUT})")
+    ap.add_argument("--compare", metavar="OLD_JSON", help="print changes vs. an earlier results file")
+    ap.add_argument("--record", action="store_true", help="save the live feeds as 'typical' fixtures and exit")
+    args = ap.parse_args()
+
+    if args.record:
+        record()
+        return
+
+    data = run(args.sizes, args.repeat)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"wrote {args.out}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(json.load(f), data)
+
+
+if __name__ == "__main__":
+    main()
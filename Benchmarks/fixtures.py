@@ -0,0 +1,145 @@
+"""
+Feed payloads for the benchmarks, per provider and size.
+
+A recorded payload in Benchmarks/fixtures/<provider>-<size>.<ext> wins
+(capture the live feeds with `py -m Benchmarks.benchSuite --record` and commit
+them, so runs stay comparable across machines); otherwise a deterministic
+synthetic payload is generated. No recordings ship yet, so out of the box
+every size is synthetic: the same structure as the real feeds, but made-up
+text and sizes, so the numbers are for comparing runs, not for predicting
+live costs. --record only captures "typical" (a live feed has one size).
+"""
+import hashlib
+import email.utils
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+SIZES = ("small", "typical", "large")
+PROVIDERS = ("cloudflare", "google", "securly", "microsoft")
+EXTENSIONS = {"cloudflare": "json", "google": "atom", "securly": "rss", "microsoft": "html"}
+CONTENT_TYPES = {
+    "cloudflare": "application/json",
+    "google": "application/atom+xml",
+    "securly": "application/rss+xml",
+    "microsoft": "text/html; charset=utf-8",
+}
+
+# entries/components/rows per size; "large" is the pathological case
+COUNTS = {"small": 5, "typical": 150, "large": 5000}
+
+# relative to now so the feeds' age cutoff sees the same history on every run
+_NOW = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+# fixed "now" for payload_id(), so a synthetic payload's digest only changes with the generator
+_DIGEST_NOW = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def _words(i: int, n: int) -> str:
+    vocab = ["users", "may", "experience", "delays", "when", "accessing", "mail", "files",
+             "in", "some", "regions", "we", "are", "investigating", "the", "issue"]
+    return " ".join(vocab[(i + k) % len(vocab)] for k in range(n))
+
+
+def cloudflare(size: str, now: datetime | None = None) -> bytes:
+    n, now = COUNTS[size], now or _NOW
+    incidents = [] if size == "small" else [
+        {
+            "id": f"inc{i}",
+            "updated_at": (now - timedelta(minutes=10 * i)).isoformat(),
+            "name": f"Elevated errors in {'North America' if i % 3 == 0 else 'Europe'} ({i})",
+            "impact": ("minor", "major", "none")[i % 3],
+            "shortlink": f"https://stspg.io/{i}",
+            "incident_updates": [{"body": _words(i, 40 if size == "large" else 12)} for _ in range(3)],
+        }
+        for i in range(max(1, n // 100))
+    ]
+    data = {
+        "page": {"id": "bench", "name": "Cloudflare"},
+        "status": {"indicator": "none" if size == "small" else "minor",
+                   "description": "All Systems Operational" if size == "small" else "Minor Service Outage"},
+        "components": [
+            {"id": f"c{i}", "name": f"PoP {i}", "status": "operational", "description": _words(i, 6)}
+            for i in range(n * 2)
+        ],
+        "incidents": incidents,
+    }
+    return json.dumps(data).encode("utf-8")
+
+
+def google(size: str, now: datetime | None = None) -> bytes:
+    n, now = COUNTS[size], now or _NOW
+    entries = []
+    for i in range(n):
+        title = ("RESOLVED: " if i % 4 else "") + f"Gmail service disruption {i}"
+        updated = (now - timedelta(hours=6 * i)).isoformat().replace("+00:00", "Z")
+        entries.append(
+            f"<entry><id>tag:google,{i}</id><title>{title}</title><updated>{updated}</updated>"
+            f"<link rel=\"alternate\" href=\"https://www.google.com/appsstatus/dashboard/incidents/{i}\"/>"
+            f"<summary type=\"html\">{_words(i, 60)} degraded</summary></entry>"
+        )
+    return ('<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            "<title>Google Workspace Status Dashboard Updates</title>"
+            + "".join(entries) + "</feed>").encode("utf-8")
+
+
+def securly(size: str, now: datetime | None = None) -> bytes:
+    n, now = COUNTS[size], now or _NOW
+    items = []
+    for i in range(n):
+        desc = "Resolved - " if i % 5 else "Investigating - "
+        items.append(
+            f"<item><title>Filtering latency {i}</title><guid>{i}</guid>"
+            f"<description>{desc}{_words(i, 40)}</description>"
+            f"<link>https://securly.status.io/pages/incident/{i}</link>"
+            f"<pubDate>{email.utils.format_datetime(now - timedelta(hours=8 * i))}</pubDate></item>"
+        )
+    return ("<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>Securly Status</title>"
+            + "".join(items) + "</channel></rss>").encode("utf-8")
+
+
+def microsoft(size: str, now: datetime | None = None) -> bytes:
+    # no dates in this page; `now` only keeps the GENERATORS signature uniform
+    n = COUNTS[size] * 4
+    parts = ["<html><head><title>Microsoft status</title><style>.x{color:red}</style>",
+             "<script>window.__data = {\"outage\": false};</script></head><body>",
+             "<div class='banner'>All systems operational</div><ul>"]
+    for i in range(n):
+        parts.append(f"<li><span>Service {i}</span> <b>Available</b> <a href='/s/{i}'>{_words(i, 5)}</a></li>")
+    if size != "small":
+        parts.append("<div role='alert'>Exchange Online: degraded mail flow in North America</div>")
+    parts.append("</ul></body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def statuspage_probe(summary: bytes) -> bytes:
+    """The /api/v2/status.json a Statuspage site serves next to a given summary.json."""
+    data = json.loads(summary)
+    return json.dumps({"page": data.get("page", {}), "status": data.get("status", {})}).encode("utf-8")
+
+
+GENERATORS = {"cloudflare": cloudflare, "google": google, "securly": securly, "microsoft": microsoft}
+
+
+def fixture_path(provider: str, size: str) -> str:
+    return os.path.join(FIXTURE_DIR, f"{provider}-{size}.{EXTENSIONS[provider]}")
+
+
+def load(provider: str, size: str) -> tuple[bytes, bool]:
+    """Returns (payload, recorded?)."""
+    path = fixture_path(provider, size)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read(), True
+    return GENERATORS[provider](size), False
+
+
+def payload_id(provider: str, size: str) -> str:
+    """What load() serves, for telling runs apart: a recording's sha1, or "synthetic:<sha1>"
+    of the generator's output with its dates pinned (so it changes with the generator, not the clock)."""
+    path = fixture_path(provider, size)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    return "synthetic:" + hashlib.sha1(GENERATORS[provider](size, now=_DIGEST_NOW)).hexdigest()
@@ -0,0 +1,112 @@
+"""
+Local stand-in for the four status feeds, serving Benchmarks.fixtures payloads.
+
+    with StubServer("typical") as stub:
+        with stub.pointed_at():   # statusSources provider registry -> this server
+            statusSources.build_segments()
+"""
+import contextlib
+import gzip
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from Benchmarks import fixtures
+from Utility import statusSources
+
+# statusSources provider name -> fixture it should serve
+PROVIDER_FIXTURES = {
+    "Cloudflare": "cloudflare",
+    "Google Workspace": "google",
+    "Securly": "securly",
+    "Microsoft Cloud": "microsoft",
+}
+
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # parsers that stop early hang up mid-body; that's expected here
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class StubServer:
+    def __init__(self, size: str, latency: float = 0.0, compress: bool = True):
+        self.size = size
+        self.latency = latency
+        self.compress = compress  # gzip bodies for clients that accept it, like the real sites
+        self.payloads = {p: fixtures.load(p, size)[0] for p in fixtures.PROVIDERS}
+        self.probe = fixtures.statuspage_probe(self.payloads["cloudflare"])
+        self._gzipped = {}
+        self.bytes_served = 0
+        self._server = None
+
+    def __enter__(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                # first path component picks the fixture: /cloudflare/api/v2/summary.json -> cloudflare
+                path = self.path.split("?")[0].strip("/")
+                provider = path.split("/")[0]
+                body = stub.payloads.get(provider)
+                if provider == "cloudflare" and path.endswith("api/v2/status.json"):
+                    body = stub.probe
+                if body is None:
+                    self.send_error(404)
+                    return
+                if stub.latency:
+                    time.sleep(stub.latency)
+                gzipped = stub.compress and "gzip" in (self.headers.get("Accept-Encoding") or "")
+                if gzipped:
+                    body = stub.gzipped(body)
+                self.send_response(200)
+                self.send_header("Content-Type", fixtures.CONTENT_TYPES[provider])
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                stub.bytes_served += len(body)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        self._server = _QuietServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def gzipped(self, body: bytes) -> bytes:
+        key = id(body)
+        if key not in self._gzipped:
+            self._gzipped[key] = gzip.compress(body, mtime=0)
+        return self._gzipped[key]
+
+    def url(self, provider: str) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/{provider}"
+
+    @contextlib.contextmanager
+    def pointed_at(self):
+        """Temporarily points the statusSources provider registry at this stub."""
+        saved = statusSources.PROVIDERS
+        stubbed = []
+        for spec in saved:
+            provider = PROVIDER_FIXTURES.get(spec["name"])
+            if provider is not None:
+                spec = dict(spec, **{"base" if spec["kind"] == "statuspage" else "url": self.url(provider)})
+            stubbed.append(spec)
+        try:
+            statusSources.set_providers(stubbed)
+            yield self
+        finally:
+            statusSources.set_providers(saved)
@@ -0,0 +1,44 @@
+from Utility import statusSources
+
+
+class Segment:
+    """One provider's entry on the ticker. The overlay's source of truth for what is drawn."""
+
+    __slots__ = ("text", "sev", "url", "clickable", "source")
+
+    def __init__(self, text: str, sev: int, url: str | None = None, clickable: bool = False,
+                 source: str | None = None):
+        self.text = text
+        self.sev = sev
+        self.url = url
+        self.clickable = clickable
+        self.source = source
+
+    @classmethod
+    def from_dict(cls, seg: dict) -> "Segment":
+        """Build from a statusSources segment dict (extra keys like "elapsed" are ignored)."""
+        return cls(seg["text"], seg["sev"], seg.get("url"), bool(seg.get("clickable")), seg.get("source"))
+
+    @property
+    def color(self) -> str:
+        return statusSources.color_for_sev(self.sev)
+
+    @property
+    def is_link(self) -> bool:
+        return bool(self.clickable and self.url)
+
+    def __eq__(self, other):
+        if not isinstance(other, Segment):
+            return NotImplemented
+        return (self.text, self.sev, self.url, self.clickable, self.source) == \
+               (other.text, other.sev, other.url, other.clickable, other.source)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Segment({self.text!r}, sev={self.sev}, url={self.url!r})"
+
+
+def to_segments(segs) -> list[Segment]:
+    """Accepts statusSources dicts or Segments; returns Segments."""
+    return [s if isinstance(s, Segment) else Segment.from_dict(s) for s in segs]
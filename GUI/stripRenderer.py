@@ -0,0 +1,82 @@
+from bisect import bisect_right
+
+import GUI.uiConfig as ui
+from GUI.textMetrics import TextMeasurer
+
+# Optional: bitmap mode needs Pillow. Without it the overlay stays in text mode.
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+except ImportError:
+    Image = None
+
+
+def available() -> bool:
+    return Image is not None
+
+
+class StripBitmap:
+    """
+    Rasterizes one lap of the ticker (segments + separators, colors, link
+    underlines) into a single image, so each frame only moves that image
+    instead of Tk re-drawing every anti-aliased text item.
+
+    render() returns (PhotoImage, width, links) where links maps x-offsets in
+    the image back to URLs; see url_at().
+    """
+
+    def __init__(self, size_px: int, height: int):
+        self.height = height
+        try:
+            self.font = ImageFont.truetype(ui.BITMAP_FONT_FILE, size_px)
+        except OSError:
+            self.font = ImageFont.load_default()
+        self._metrics = TextMeasurer(lambda text, font: font.getlength(text))
+
+    def _width(self, text: str) -> int:
+        return int(round(self._metrics.width(text, self.font)))
+
+    def render(self, segments):
+        # pass 1: positions (same spacing as text mode: item, +2, separator, +2)
+        runs = []
+        x = 0
+        for seg in segments:
+            text = self._metrics.fit(seg.text, self.font, ui.SEGMENT_MAX_WIDTH_PX)
+            w = self._width(text)
+            runs.append((x, text, seg.color, seg.clickable, seg.url))
+            x += w + 2
+            runs.append((x, ui.SEP, "white", False, None))
+            x += self._width(ui.SEP) + 2
+        width = max(x, 1)
+
+        # pass 2: draw
+        img = Image.new("RGB", (width, self.height), ui.BG)
+        draw = ImageDraw.Draw(img)
+        y = (self.height // 2) - 6  # same baseline-ish center as text mode
+        starts, links = [], []
+        for rx, text, color, clickable, url in runs:
+            draw.text((rx, y), text, fill=color, font=self.font, anchor="lm")
+            if clickable:
+                _, _, right, bottom = draw.textbbox((rx, y), text, font=self.font, anchor="lm")
+                draw.line((rx, bottom + 1, right, bottom + 1), fill=color, width=1)
+            if clickable and url:
+                starts.append(rx)
+                links.append((rx, rx + self._width(text), url))
+
+        return ImageTk.PhotoImage(img), width, LinkTable(starts, links)
+
+
+class LinkTable:
+    """Sorted x-intervals of a rendered lap -> URL, looked up with bisect."""
+
+    __slots__ = ("_starts", "_links")
+
+    def __init__(self, starts, links):
+        self._starts = starts
+        self._links = links
+
+    def url_at(self, x: float) -> str | None:
+        i = bisect_right(self._starts, x) - 1
+        if i < 0:
+            return None
+        start, end, url = self._links[i]
+        return url if start <= x < end else None
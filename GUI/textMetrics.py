@@ -0,0 +1,59 @@
+"""
+Cached text widths for laying out the ticker.
+
+Laps are positioned from measured widths before any canvas item exists, so a
+layout needs no bbox round trip per item, and widths are memoized by
+(text, font) so a refresh that repeats most entries measures almost nothing.
+
+fit() cuts a text to a pixel budget with an ellipsis (SEGMENT_MAX_WIDTH_PX),
+so one verbose incident title can't make a lap several screens wide.
+"""
+ELLIPSIS = "…"
+CACHE_MAX_ENTRIES = 4096  # cleared wholesale beyond this; a lap has a few dozen strings
+
+
+def _tk_measure(text: str, font) -> float:
+    return font.measure(text)
+
+
+class TextMeasurer:
+    """
+    measure(text, font) -> pixels, through a cache. `font` is a tkinter Font by
+    default; pass measure_fn for anything else (e.g. a Pillow font's getlength).
+    Fonts are keyed by str(font), which is the Tk font name.
+    """
+
+    def __init__(self, measure_fn=_tk_measure):
+        self._measure_fn = measure_fn
+        self._widths = {}  # (text, font key) -> pixels
+        self._fitted = {}  # (text, font key, max_px) -> text
+
+    def width(self, text: str, font) -> float:
+        key = (text, str(font))
+        w = self._widths.get(key)
+        if w is None:
+            if len(self._widths) >= CACHE_MAX_ENTRIES:
+                self._widths.clear()
+            w = self._widths[key] = self._measure_fn(text, font)
+        return w
+
+    def fit(self, text: str, font, max_px: float | None) -> str:
+        """`text`, or its longest prefix + ELLIPSIS no wider than max_px."""
+        if max_px is None or self.width(text, font) <= max_px:
+            return text
+
+        key = (text, str(font), max_px)
+        fitted = self._fitted.get(key)
+        if fitted is None:
+            if len(self._fitted) >= CACHE_MAX_ENTRIES:
+                self._fitted.clear()
+            # binary search on the prefix length; probes bypass the width cache
+            lo, hi = 0, len(text)
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if self._measure_fn(text[:mid].rstrip() + ELLIPSIS, font) <= max_px:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            fitted = self._fitted[key] = text[:lo].rstrip() + ELLIPSIS
+        return fitted
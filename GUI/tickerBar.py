@@ -0,0 +1,526 @@
+import time
+import tkinter as tk
+import webbrowser
+
+from Utility import windowsAppBar
+
+from Utility import metrics
+
+from GUI import segmentModel
+
+import GUI.uiConfig as ui
+
+
+class TickerBar:
+    """
+    One ticker window on one monitor: its AppBar slot, canvas and laps.
+
+    The TickerOverlay owns the pipeline, the refresh worker and the animation
+    clock, and drives every bar from them: queue_segments() hands over a new
+    segment list, frame(dx) scrolls by dx pixels. Fonts, the status line and
+    the bitmap renderer are shared through the owner.
+
+    A bar whose content fits its width goes static (see STATIC below) and a
+    suspended one (locked session, covered monitor) doesn't move, though it
+    still takes new segments; frame() returns False for both so the owner
+    can stop its clock.
+    """
+    TICKER_TAG = "ticker"  # every scrolling canvas item carries this tag
+
+    def __init__(self, owner, window, monitor: dict | None = None):
+        self.owner = owner
+        self.window = window
+        self.monitor = monitor
+        self._appbar = False
+
+        window.overrideredirect(True)
+        window.attributes("-topmost", True)
+        window.configure(bg=ui.BG)
+        self._place_window()
+
+        self.canvas = tk.Canvas(window, height=ui.BAR_HEIGHT, bg=ui.BG, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+
+        self.status = tk.Label(window, textvariable=owner.status_var, anchor="w",
+                               bg=ui.BG, fg="#aaaaaa", padx=12, font=("Segoe UI", 9))
+        self.status.place(x=8, y=ui.BAR_HEIGHT-18)
+
+        # What is on screen: the segment model plus the laps drawing it (see RENDER).
+        # Every ticker item carries TICKER_TAG and moves in one call; lap edges
+        # are tracked arithmetically instead of via bbox.
+        self._segments = []   # list[Segment]
+        self._version = 0     # bumped whenever _segments changes
+        self._laps = []       # on-screen laps, left to right: {tag, left, right, version}
+        self._spare_laps = []
+        self._lap_seq = 0
+        self._offsets = []    # per segment: (item x, separator x) within a lap
+        self._lap_width = 0.0
+        self._pending_segments = None  # applied at the next lap boundary
+        self._static = False  # one lap parked at STATIC_X, not scrolling
+        self.suspended = False  # set by the owner (update_suspended)
+        self._covered = False   # a fullscreen window has this monitor; the bar is out of the topmost band
+
+        # Close controls
+        window.bind("<Escape>", lambda e: owner._close())
+        window.bind("<Control-q>", lambda e: owner._close())
+
+        # Allow dragging the bar (optional quality-of-life)
+        self._drag_start = None
+        window.bind("<ButtonPress-1>", self._start_drag)
+        window.bind("<B1-Motion>", self._do_drag)
+
+    def _place_window(self):
+        # Force the window to exist so we can get a real hwnd
+        self.window.update_idletasks()
+        m = self.monitor
+
+        if m is None:
+            # fallback: primary screen
+            sw = self.window.winfo_screenwidth()
+            self.window.geometry(f"{sw}x{ui.BAR_HEIGHT}+0+0")
+        elif ui.RESERVE_SPACE_FOR_MAXIMIZE:
+            # AppBar reserves space in the WORK area so maximized windows stay below it
+            hwnd = int(self.window.winfo_id())
+            left, top, right, bottom = windowsAppBar.appbar_set_top(hwnd, m, ui.BAR_HEIGHT)
+            self._appbar = True
+            width = right - left
+            self.window.geometry(f"{width}x{ui.BAR_HEIGHT}+{left}+{top}")
+        else:
+            # Just snap to monitor top without reserving space
+            width = m["right"] - m["left"]
+            self.window.geometry(f"{width}x{ui.BAR_HEIGHT}+{m['left']}+{m['top']}")
+
+    def update_suspended(self, locked: bool):
+        """Re-evaluates whether this bar can be seen; `locked` is the session-wide lock state."""
+        try:
+            covered = self.monitor is not None and windowsAppBar.fullscreen_window_on(self.monitor)
+            hidden = covered or not self.window.winfo_viewable()
+        except Exception:
+            covered = hidden = False  # when in doubt, keep animating
+        self._set_covered(covered)
+        self.suspended = locked or hidden
+
+    def _set_covered(self, covered: bool):
+        # What an AppBar does on ABN_FULLSCREENAPP: step out of the topmost band
+        # while a fullscreen window has the monitor, so that window really is on
+        # top (a topmost bar would stay drawn over it, frozen), and come back after.
+        if covered == self._covered:
+            return
+        self._covered = covered
+        try:
+            self.window.attributes("-topmost", not covered)
+            if covered:
+                self.window.lower()
+        except Exception:
+            pass
+
+    def reassert_topmost(self):
+        if self._covered:
+            return  # a fullscreen window has the monitor (see _set_covered)
+        try:
+            self.window.attributes("-topmost", True)
+        except Exception:
+            pass
+
+    def close(self):
+        """Gives back the AppBar slot. The owner destroys the windows."""
+        try:
+            if self._appbar:
+                windowsAppBar.appbar_remove(int(self.window.winfo_id()))
+        except Exception:
+            pass
+
+    def _start_drag(self, event):
+        # only drag if clicked in empty area (not on a link)
+        self._drag_start = (event.x_root, event.y_root, self.window.winfo_x(), self.window.winfo_y())
+
+    def _do_drag(self, event):
+        if not self._drag_start:
+            return
+        x0, y0, wx, wy = self._drag_start
+        dx = event.x_root - x0
+        dy = event.y_root - y0
+        self.window.geometry(f"+{wx + dx}+{wy + dy}")
+
+    def queue_segments(self, segs):
+        # Main thread only
+        self._pending_segments = segs
+
+        # BOOTSTRAP: if nothing is on-screen yet, draw it now
+        if not self._laps:
+            self._apply_pending_now_if_empty()
+        elif self._static:
+            self._apply_pending_static()  # nothing scrolls, so no lap boundary to wait for
+
+    def frame(self, dx: float) -> bool:
+        """One animation step, driven by the owner's clock. Returns False if the bar needs no frames."""
+        if self.suspended:
+            if self._pending_segments is not None and self._laps and not self._static:
+                self._apply_pending_in_place()  # no motion, so no lap boundary will come
+            return False
+
+        # If we have nothing on screen yet, try to apply pending (bootstrap safety)
+        if not self._laps:
+            self._apply_pending_now_if_empty()
+            return bool(self._laps)
+
+        if self._static:
+            if not self._fits(self._laps[0]):  # the bar got narrower
+                self._unsettle()
+            return not self._static
+
+        # Move the whole chain left in one Tk call
+        if dx:
+            self._advance(dx)
+
+        self._recycle_laps()
+        self._settle_if_fits()
+        return not self._static
+
+    def _bind_click(self, item_id: int, url: str):
+        def _open(_evt=None):
+            try:
+                webbrowser.open(url)
+            except Exception:
+                pass
+
+        def _enter(_evt=None):
+            # Canvas items may not support -cursor on some Tk builds,
+            # so set cursor on the canvas widget instead.
+            try:
+                self.canvas.configure(cursor="hand2")
+            except Exception:
+                pass
+
+        def _leave(_evt=None):
+            try:
+                self.canvas.configure(cursor="")
+            except Exception:
+                pass
+
+        self.canvas.tag_bind(item_id, "<Button-1>", _open)
+        self.canvas.tag_bind(item_id, "<Enter>", _enter)
+        self.canvas.tag_bind(item_id, "<Leave>", _leave)
+
+
+    def _unbind_click(self, item_id: int):
+        for sequence in ("<Button-1>", "<Enter>", "<Leave>"):
+            self.canvas.tag_unbind(item_id, sequence)
+
+
+    def _bind_strip_clicks(self, item_id: int, links):
+        # One image per lap: map the click's x-offset inside the image back to a URL
+        def _url_at(evt):
+            left = self.canvas.coords(item_id)[0]
+            return links.url_at(self.canvas.canvasx(evt.x) - left)
+
+        def _open(evt):
+            url = _url_at(evt)
+            if not url:
+                return
+            try:
+                webbrowser.open(url)
+            except Exception:
+                pass
+
+        def _motion(evt):
+            try:
+                self.canvas.configure(cursor="hand2" if _url_at(evt) else "")
+            except Exception:
+                pass
+
+        def _leave(_evt=None):
+            try:
+                self.canvas.configure(cursor="")
+            except Exception:
+                pass
+
+        self.canvas.tag_bind(item_id, "<Button-1>", _open)
+        self.canvas.tag_bind(item_id, "<Motion>", _motion)
+        self.canvas.tag_bind(item_id, "<Leave>", _leave)
+
+    # ----------------------------
+    # RENDER
+    # ----------------------------
+    # The ticker is a chain of "laps": copies of the same strip laid end to end,
+    # each ending in a separator, so the loop never shows a gap. A lap that has
+    # scrolled off the left is parked and reused at the tail. A refresh never
+    # rebuilds laps: when a parked lap showing older content is reused, only the
+    # segments that changed are reconfigured and the rest re-flowed (_patch_lap).
+    # Canvas items are only created/destroyed when the segment count changes.
+    # Positions within a lap are computed once per content change from cached
+    # text widths (_offsets), so items are created where they belong and
+    # re-flowing is plain coords calls, never bbox.
+    LAP_Y = (ui.BAR_HEIGHT // 2) - 6  # visually centered-ish
+
+    def _set_segments(self, segs):
+        segs = segmentModel.to_segments(segs)
+        if segs == self._segments:
+            return  # identical content: keep every lap as is
+        self._segments = segs
+        self._version += 1
+        if self.owner._bitmap is None:  # a bitmap strip is laid out by stripRenderer
+            t0 = time.perf_counter()
+            self._offsets, self._lap_width = self._measure_lap(segs)
+            metrics.observe("ticker_layout_seconds", time.perf_counter() - t0, stage="measure")
+
+    def _font_for(self, seg):
+        return self.owner.ticker_font_u if seg.clickable else self.owner.ticker_font
+
+    def _display_text(self, seg) -> str:
+        return self.owner.text_metrics.fit(seg.text, self._font_for(seg), ui.SEGMENT_MAX_WIDTH_PX)
+
+    def _measure_lap(self, segs):
+        # (item x, separator x) per segment relative to the lap's left edge, and
+        # the lap width; same spacing as ever: item, +2, separator, +2
+        tm = self.owner.text_metrics
+        sep_w = tm.width(ui.SEP, self.owner.ticker_font)
+        offsets, x = [], 0.0
+        for seg in segs:
+            sep_x = x + tm.width(self._display_text(seg), self._font_for(seg)) + 2
+            offsets.append((x, sep_x))
+            x = sep_x + sep_w + 2
+        return offsets, x
+
+    def _style_segment_item(self, item_id: int, seg, old=None):
+        # old = the Segment this item showed before; only differing options are sent to Tk
+        opts = {}
+        if old is None or seg.text != old.text:
+            opts["text"] = self._display_text(seg)
+        if old is None or seg.color != old.color:
+            opts["fill"] = seg.color
+        if old is None or seg.clickable != old.clickable:
+            opts["font"] = self._font_for(seg)
+        if opts:
+            self.canvas.itemconfigure(item_id, **opts)
+
+        if seg.is_link and (old is None or seg.url != old.url or not old.is_link):
+            self._bind_click(item_id, seg.url)
+        elif old is not None and old.is_link and not seg.is_link:
+            self._unbind_click(item_id)
+
+    def _create_segment_items(self, seg, tags, x: float, sep_x: float) -> tuple[int, int]:
+        item_id = self.canvas.create_text(x, self.LAP_Y, anchor="w", tags=tags)
+        self._style_segment_item(item_id, seg)
+        sep_id = self.canvas.create_text(
+            sep_x, self.LAP_Y, text=ui.SEP, fill='white', font=self.owner.ticker_font, anchor="w", tags=tags
+        )
+        return item_id, sep_id
+
+    def _flow(self, items, first: int, left: float):
+        # moves items[first:] to their _offsets in a lap starting at `left`
+        for (item_id, sep_id), (x, sep_x) in zip(items[first:], self._offsets[first:]):
+            self.canvas.coords(item_id, left + x, self.LAP_Y)
+            self.canvas.coords(sep_id, left + sep_x, self.LAP_Y)
+
+    def _build_lap(self, x: float) -> dict:
+        t0 = time.perf_counter()
+        lap = self._build_bitmap_lap(x) if self.owner._bitmap is not None else self._build_text_lap(x)
+        metrics.observe("ticker_layout_seconds", time.perf_counter() - t0, stage="build")
+        return lap
+
+    def _build_text_lap(self, x: float) -> dict:
+        self._lap_seq += 1
+        lap_tag = f"lap{self._lap_seq}"
+        tags = (self.TICKER_TAG, lap_tag)
+
+        items = [self._create_segment_items(seg, tags, x + dx, x + sep_dx)
+                 for seg, (dx, sep_dx) in zip(self._segments, self._offsets)]
+
+        return {"tag": lap_tag, "left": float(x), "right": float(x + self._lap_width), "version": self._version,
+                "items": items, "segments": self._segments}
+
+    def _patch_lap(self, lap: dict):
+        """Brings a parked lap up to the current _segments, touching only what changed."""
+        t0 = time.perf_counter()
+        self._patch_lap_items(lap)
+        metrics.observe("ticker_layout_seconds", time.perf_counter() - t0, stage="patch")
+
+    def _patch_lap_items(self, lap: dict):
+        if self.owner._bitmap is not None:
+            photo, width, links = self.owner._render_strip(self._segments)
+            self.canvas.itemconfigure(lap["item"], image=photo)
+            self._bind_strip_clicks(lap["item"], links)
+            lap.update(right=lap["left"] + width, version=self._version, image=photo)
+            return
+
+        old, new, items = lap["segments"], self._segments, lap["items"]
+        first = next((i for i, (a, b) in enumerate(zip(old, new)) if a != b), min(len(old), len(new)))
+
+        for item_id, sep_id in items[len(new):]:
+            self.canvas.delete(item_id)
+            self.canvas.delete(sep_id)
+        del items[len(new):]
+
+        tags, left = (self.TICKER_TAG, lap["tag"]), lap["left"]
+        reused = len(items)
+        for i in range(first, len(new)):
+            if i < reused:
+                if new[i] != old[i]:
+                    self._style_segment_item(items[i][0], new[i], old[i])
+            else:
+                dx, sep_dx = self._offsets[i]
+                items.append(self._create_segment_items(new[i], tags, left + dx, left + sep_dx))
+
+        # everything right of the first change shifts by however much that text grew/shrank
+        self._flow(items[:reused], first, left)
+        lap.update(right=left + self._lap_width, version=self._version, segments=new)
+
+    def _build_bitmap_lap(self, x: float) -> dict:
+        photo, width, links = self.owner._render_strip(self._segments)
+
+        self._lap_seq += 1
+        lap_tag = f"lap{self._lap_seq}"
+        item_id = self.canvas.create_image(
+            x, 0, image=photo, anchor="nw", tags=(self.TICKER_TAG, lap_tag)
+        )
+        self._bind_strip_clicks(item_id, links)
+
+        # the lap keeps its own image reference so old content stays drawn after a refresh
+        return {"tag": lap_tag, "left": float(x), "right": float(x + width),
+                "version": self._version, "image": photo, "item": item_id}
+
+    def _place_lap(self, x: float) -> dict:
+        if self._spare_laps:
+            lap = self._spare_laps.pop()
+            if lap["version"] != self._version:
+                self._patch_lap(lap)
+            shift = x - lap["left"]
+            self.canvas.move(lap["tag"], shift, 0)
+            lap["left"] += shift
+            lap["right"] += shift
+            return lap
+        return self._build_lap(x)
+
+    def _clear_items(self):
+        self.canvas.delete(self.TICKER_TAG)
+        self._laps = []
+        self._spare_laps = []
+        self._static = False
+
+    def _layout_segments_off_right(self, segs):
+        self._clear_items()
+        self._set_segments(segs)
+
+        w = max(self.canvas.winfo_width(), 1)
+        self._fill_laps(w, start_x=w + 10)
+
+    def _fill_laps(self, w: int, start_x: float):
+        if not self._segments:
+            return
+        # keep the chain reaching past the right edge; new laps enter at the edge
+        while not self._laps or self._laps[-1]["right"] <= w:
+            x = self._laps[-1]["right"] if self._laps else start_x
+            self._laps.append(self._place_lap(x))
+
+    def _advance(self, dx: float):
+        # one Tk call moves every lap (parked ones too); bookkeeping is arithmetic
+        self.canvas.move(self.TICKER_TAG, -dx, 0)
+        for lap in self._laps:
+            lap["left"] -= dx
+            lap["right"] -= dx
+        for lap in self._spare_laps:
+            lap["left"] -= dx
+            lap["right"] -= dx
+
+    def _recycle_laps(self):
+        w = max(self.canvas.winfo_width(), 1)
+
+        while self._laps and self._laps[0]["right"] < 0:
+            # parked even if it shows older content; _place_lap patches it on reuse
+            self._spare_laps.append(self._laps.pop(0))
+
+        if self._laps and self._laps[-1]["right"] > w:
+            return
+
+        # Lap boundary at the right edge: apply any pending refresh NOW (no mid-scroll jump)
+        segs, self._pending_segments = self._pending_segments, None
+        if segs is not None:
+            self._set_segments(segs)
+
+        self._fill_laps(w, start_x=w)
+
+    def _apply_pending_in_place(self):
+        # Suspended bar: patch the on-screen laps where they stand and re-chain
+        # them, so it never shows (or comes back with) stale status
+        segs, self._pending_segments = self._pending_segments, None
+        self._set_segments(segs)
+        x = self._laps[0]["left"]
+        for lap in self._laps:
+            if lap["version"] != self._version:
+                self._patch_lap(lap)
+            shift = x - lap["left"]
+            self.canvas.move(lap["tag"], shift, 0)
+            lap["left"] += shift
+            lap["right"] += shift
+            x = lap["right"]
+        self._fill_laps(max(self.canvas.winfo_width(), 1), start_x=x)
+
+    def _apply_pending_if_any(self):
+        segs, self._pending_segments = self._pending_segments, None
+        if segs is not None:
+            self._layout_segments_off_right(segs)
+
+    def _apply_pending_now_if_empty(self):
+        # Only used to draw the very first time so the bar isn't blank
+        if self.owner._closing or self._laps:
+            return
+
+        segs, self._pending_segments = self._pending_segments, None
+        if segs is not None:
+            self._layout_segments_off_right(segs)
+
+    # ----------------------------
+    # STATIC
+    # ----------------------------
+    # When one lap is narrower than the bar, scrolling buys nothing: the lap
+    # showing the current content scrolls in until its left edge reaches
+    # STATIC_X, settles there, and the bar stops asking for frames. Updates are
+    # then patched into that lap in place; if it outgrows the bar, the laps
+    # behind it are rebuilt and scrolling resumes from where it stands.
+    def _fits(self, lap: dict) -> bool:
+        return lap["right"] - lap["left"] <= max(self.canvas.winfo_width(), 1) - ui.STATIC_X
+
+    def _settle_if_fits(self):
+        if not ui.STATIC_WHEN_FITS or self._pending_segments is not None:
+            return
+        lap = next((l for l in self._laps if l["version"] == self._version and l["left"] <= ui.STATIC_X), None)
+        if lap is None or not self._fits(lap):
+            return
+
+        for other in self._laps:
+            if other is not lap:
+                self.canvas.delete(other["tag"])
+        shift = ui.STATIC_X - lap["left"]
+        self.canvas.move(lap["tag"], shift, 0)
+        lap["left"] += shift
+        lap["right"] += shift
+        self._laps = [lap]
+        self._static = True
+        self._show_trailing_sep(lap, False)
+
+    def _apply_pending_static(self):
+        segs, self._pending_segments = self._pending_segments, None
+        if segs is None:
+            return
+        self._set_segments(segs)
+        lap = self._laps[0]
+        if lap["version"] == self._version:
+            return
+        self._show_trailing_sep(lap, True)
+        self._patch_lap(lap)
+        if self._fits(lap):
+            self._show_trailing_sep(lap, False)
+        else:
+            self._unsettle()
+
+    def _unsettle(self):
+        self._static = False
+        self._show_trailing_sep(self._laps[0], True)
+        # the chain behind the parked lap is rebuilt by the next frame's _recycle_laps
+
+    def _show_trailing_sep(self, lap: dict, show: bool):
+        # a static strip ends at its last entry, not at a separator (text mode only;
+        # a bitmap strip keeps it baked in)
+        if lap.get("items"):
+            self.canvas.itemconfigure(lap["items"][-1][1], state="normal" if show else "hidden")
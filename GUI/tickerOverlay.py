@@ -1,86 +1,108 @@
+import queue
 import threading
 import time
 import tkinter as tk
 from tkinter import font as tkfont
-import webbrowser
-
-import ctypes
-from ctypes import wintypes
-
-import requests
-from bs4 import BeautifulSoup
 
+# Keep this import list light: the bar is painted before the first refresh,
+# and HTTP/parser modules (requests, bs4, Pillow) load on first use instead.
 from Utility import windowsAppBar
 
-from Utility import statusSources
+from Utility import metrics
+from Utility.refreshWorker import RefreshWorker
+from Utility.statusPipeline import StatusPipeline, describe
+
+from GUI.textMetrics import TextMeasurer
+from GUI.tickerBar import TickerBar
 
 import GUI.uiConfig as ui
 
 
-class TickerOverlay(tk.Tk):
-    def __init__(self):
-        super().__init__()
+def monitors_to_cover() -> list:
+    """Monitor rects to put a bar on (MONITORS / MONITOR_INDEX); [None] = primary screen fallback."""
+    monitors = windowsAppBar.get_monitors()
+    if not monitors:
+        return [None]
+    if ui.MONITORS == "all":
+        return monitors
+    return [monitors[max(0, min(ui.MONITOR_INDEX, len(monitors) - 1))]]
 
-        self.overrideredirect(True)
-        self.attributes("-topmost", True)
-        self.configure(bg=ui.BG)
 
-        # Force the window to exist so we can get a real hwnd
-        self.update_idletasks()
-        hwnd = int(self.winfo_id())
+def frame_interval_ms() -> int:
+    """Frame pacing: no faster than the display refreshes or than one pixel of movement per frame."""
+    hz = ui.DISPLAY_HZ
+    if hz is None:
+        try:
+            hz = windowsAppBar.display_refresh_hz()
+        except Exception:
+            hz = None
+    frame_s = max(1 / (hz or 60), 1 / ui.SCROLL_PIXELS_PER_SECOND)
+    return max(1, round(frame_s * 1000))
 
-        monitors = windowsAppBar.get_monitors()
-        if not monitors:
-            # fallback: primary screen
-            sw = self.winfo_screenwidth()
-            self.geometry(f"{sw}x{ui.BAR_HEIGHT}+0+0")
-        else:
-            idx = max(0, min(ui.MONITOR_INDEX, len(monitors) - 1))
-            m = monitors[idx]
 
-            if ui.RESERVE_SPACE_FOR_MAXIMIZE:
-                # AppBar reserves space in the WORK area so maximized windows stay below it
-                left, top, right, bottom = windowsAppBar.appbar_set_top(hwnd, m, ui.BAR_HEIGHT)
-                width = right - left
-                self.geometry(f"{width}x{ui.BAR_HEIGHT}+{left}+{top}")
-            else:
-                # Just snap to monitor top without reserving space
-                width = m["right"] - m["left"]
-                self.geometry(f"{width}x{ui.BAR_HEIGHT}+{m['left']}+{m['top']}")
+class TickerOverlay(tk.Tk):
+    """
+    The app: one refresh pipeline and one animation clock driving a TickerBar
+    per covered monitor (this root window hosts the first, Toplevels the rest).
+    """
 
+    def __init__(self):
+        super().__init__()
 
         # Optional: keep from stealing focus on click (Windows may still focus it)
         # self.attributes("-disabled", True)  # not reliable across platforms
 
-        self.canvas = tk.Canvas(self, height=ui.BAR_HEIGHT, bg=ui.BG, highlightthickness=0)
-        self.canvas.pack(fill="both", expand=True)
-
+        # Shared by every bar
         self.ticker_font = tkfont.Font(family="Segoe UI", size=14, weight="bold")
         self.ticker_font_u = tkfont.Font(family="Segoe UI", size=14, weight="bold", underline=True)
-
         self.status_var = tk.StringVar(value="Starting…")
-        self.status = tk.Label(self, textvariable=self.status_var, anchor="w",
-                               bg=ui.BG, fg="#aaaaaa", padx=12, font=("Segoe UI", 9))
-        self.status.place(x=8, y=ui.BAR_HEIGHT-18)
-
-        self.items = []  # list of dicts: {id, kind, url}
-        self._lock = threading.Lock()
-        self._pending_segments = None
+        self.text_metrics = TextMeasurer()
+
+        # Optional pre-rendered strip (RENDER_MODE = "bitmap"); None = text items
+        self._bitmap = None
+        self._strip = None  # (segments, (PhotoImage, width, LinkTable)), shared by the bars
+        if ui.RENDER_MODE == "bitmap":
+            from GUI import stripRenderer  # imports Pillow, so only in bitmap mode
+
+            if stripRenderer.available():
+                size_px = int(round(self.winfo_fpixels("14p")))
+                self._bitmap = stripRenderer.StripBitmap(size_px, ui.BAR_HEIGHT)
+
+        self._last_frame = None
+        self._frame_ms = frame_interval_ms()
+        self._animate_job = None
+        self._clock_idle = False      # no bar scrolling: ticking at IDLE_CHECK_MS
+        self._suspend_checked = 0.0   # monotonic time of the last lock/visibility check
         self._closing = False
 
-        # Close controls
-        self.bind("<Escape>", lambda e: self._close())
-        self.bind("<Control-q>", lambda e: self._close())
+        self.bars = []
+        for i, monitor in enumerate(monitors_to_cover()):
+            window = self if i == 0 else tk.Toplevel(self)
+            self.bars.append(TickerBar(self, window, monitor))
+
+        # Each provider polls on its own cadence; last good segment per provider
+        self._pipeline = StatusPipeline()
+        self._worker = None  # RefreshWorker, unless following an aggregator
 
-        # Allow dragging the bar (optional quality-of-life)
-        self._drag_start = None
-        self.bind("<ButtonPress-1>", self._start_drag)
-        self.bind("<B1-Motion>", self._do_drag)
+        # Background threads never touch Tk: they put messages here and the
+        # main loop drains them (_drain_ui_queue)
+        self._ui_queue = queue.SimpleQueue()
 
-        # Start
-        self.after(100, self._refresh_in_background)
-        self.after(ui.TICK_MS, self._animate)
-        self.after(ui.REFRESH_EVERY_SECONDS * 1000, self._scheduled_refresh)
+        # Optional metrics export (see METRICS_* in uiConfig)
+        if ui.METRICS_PORT:
+            metrics.start_http(ui.METRICS_PORT)
+        if ui.METRICS_FILE:
+            metrics.start_file_writer(ui.METRICS_FILE, ui.METRICS_FILE_EVERY_SECONDS)
+
+        # Start: fetch directly, or follow a shared aggregator (AGGREGATOR_URL)
+        if ui.AGGREGATOR_URL:
+            threading.Thread(target=self._follow_aggregator, daemon=True).start()
+        else:
+            self._worker = RefreshWorker(self._pipeline, self._ui_queue)
+            self._warm_start()
+            self.after(100, self._scheduled_refresh)
+        self.after(ui.UI_QUEUE_DRAIN_MS, self._drain_ui_queue)
+        self._animate_job = self.after(self._frame_ms, self._animate)
 
         # Re-assert topmost periodically (helps with some apps)
         self.after(2000, self._reassert_topmost)
@@ -88,99 +110,112 @@ class TickerOverlay(tk.Tk):
     def _reassert_topmost(self):
         if self._closing:
             return
-        try:
-            self.attributes("-topmost", True)
-        except Exception:
-            pass
+        for bar in self.bars:
+            bar.reassert_topmost()
         self.after(2000, self._reassert_topmost)
 
     def _close(self):
+        if self._closing:
+            return  # every bar's window binds Escape / Ctrl+Q
         self._closing = True
-        try:
-            if ui.RESERVE_SPACE_FOR_MAXIMIZE:
-                windowsAppBar.appbar_remove(int(self.winfo_id()))
-        except Exception:
-            pass
+        if self._worker is not None:
+            self._worker.stop()  # cancels an in-flight refresh
+        for bar in self.bars:
+            bar.close()
         self.destroy()
 
     def _set_status(self, txt: str):
-        self.after(0, lambda: self.status_var.set(txt))
-
-    def _start_drag(self, event):
-        # only drag if clicked in empty area (not on a link)
-        self._drag_start = (event.x_root, event.y_root, self.winfo_x(), self.winfo_y())
-
-    def _do_drag(self, event):
-        if not self._drag_start:
-            return
-        x0, y0, wx, wy = self._drag_start
-        dx = event.x_root - x0
-        dy = event.y_root - y0
-        self.geometry(f"+{wx + dx}+{wy + dy}")
+        # safe from any thread
+        self._ui_queue.put(("status", txt))
+
+    def _render_strip(self, segments):
+        # Bitmap mode: one render per content change, however many bars show it
+        if self._strip is None or self._strip[0] != segments:
+            self._strip = (segments, self._bitmap.render(segments))
+        return self._strip[1]
+
+    def _warm_start(self):
+        # Draw the last saved status right away, each entry marked "(as of HH:MM)";
+        # live results replace it provider by provider as they arrive
+        segs = self._pipeline.warm_start() if ui.WARM_START else []
+        if segs:
+            self._queue_segments(segs)
 
     def _scheduled_refresh(self):
         if self._closing:
             return
-        self._refresh_in_background()
-        self.after(ui.REFRESH_EVERY_SECONDS * 1000, self._scheduled_refresh)
-
-    def _refresh_in_background(self):
-        def worker():
-            start = time.time()
-            try:
-                segs = statusSources.build_segments()
-
-                with self._lock:
-                    self._pending_segments = segs
-
-                elapsed = time.time() - start
-                self._set_status(
-                    f"Refreshed in {elapsed:.1f}s • Will apply on next loop • Next {ui.REFRESH_EVERY_SECONDS}s • Esc/Ctrl+Q to close"
-                )
-
-                # BOOTSTRAP: if nothing is on-screen yet, trigger an immediate apply
-                # (must be done on Tk main thread)
-                if not self.items:
-                    self.after(0, self._apply_pending_now_if_empty)
-
-            except Exception as e:
-                self._set_status(f"Refresh failed: {e!r} (retrying)")
-
-        self._set_status("Refreshing status…")
-        threading.Thread(target=worker, daemon=True).start()
-
-
-
-    def _clear_items(self):
-        for item in self.items:
-            self.canvas.delete(item["id"])
-        self.items = []
-
-    def _bind_click(self, item_id: int, url: str):
-        def _open(_evt=None):
-            try:
-                webbrowser.open(url)
-            except Exception:
-                pass
+        due = self._pipeline.claim_due()
+        if due:
+            self._worker.request(due)  # merged with anything still pending
+        self.after(ui.POLL_CHECK_MS, self._scheduled_refresh)
+
+    def _drain_ui_queue(self):
+        # Main thread: handle up to UI_QUEUE_BATCH messages; within a batch only the
+        # newest segment list and status line matter
+        if self._closing:
+            return
 
-        def _enter(_evt=None):
-            # Canvas items may not support -cursor on some Tk builds,
-            # so set cursor on the canvas widget instead.
+        segs = status = None
+        for _ in range(ui.UI_QUEUE_BATCH):
             try:
-                self.canvas.configure(cursor="hand2")
-            except Exception:
-                pass
+                msg = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            kind = msg[0]
+            if kind == "status":
+                status = msg[1]
+            elif kind == "segments":
+                segs = msg[1]
+            elif kind == "refreshing":
+                status = "Refreshing status…"
+            elif kind == "report":
+                report, names = msg[1], msg[2]
+                if report["changed"]:
+                    segs = report["segments"]
+                applied = "Will apply on next loop" if report["changed"] else "No changes"
+                next_in = self._pipeline.scheduler.soonest_due_in()
+                status = f"{describe(report, names)} • {applied} • Next {next_in:.0f}s • Esc/Ctrl+Q to close"
+            elif kind == "error":
+                next_in = self._pipeline.scheduler.soonest_due_in()
+                status = f"Refresh failed: {msg[1]!r} (retrying in {next_in:.0f}s)"
 
-        def _leave(_evt=None):
+        if segs is not None:
+            self._queue_segments(segs)
+        if status is not None:
+            self.status_var.set(status)
+        self.after(ui.UI_QUEUE_DRAIN_MS, self._drain_ui_queue)
+
+    def _queue_segments(self, segs):
+        # Main thread only; each bar applies it at its own next lap boundary
+        for bar in self.bars:
+            bar.queue_segments(segs)
+        self._wake_clock()
+
+    def _follow_aggregator(self):
+        # Worker thread: long-poll the aggregator; it does all upstream fetching
+        from Utility import aggregator
+
+        client = aggregator.AggregatorClient(ui.AGGREGATOR_URL)
+        self._set_status(f"Connecting to {ui.AGGREGATOR_URL}…")
+        retry = 1
+        while not self._closing:
             try:
-                self.canvas.configure(cursor="")
-            except Exception:
-                pass
-
-        self.canvas.tag_bind(item_id, "<Button-1>", _open)
-        self.canvas.tag_bind(item_id, "<Enter>", _enter)
-        self.canvas.tag_bind(item_id, "<Leave>", _leave)
-
+                data = client.wait_for_change()
+                retry = 1
+            except Exception as e:
+                self._set_status(f"Aggregator unreachable: {e!r} (retrying in {retry}s)")
+                time.sleep(retry)
+                retry = min(retry * 2, 60)
+                continue
+
+            if data is None or not data["segments"]:
+                continue
+            self._ui_queue.put(("segments", data["segments"]))
+            age = time.time() - data["updated"]
+            self._set_status(
+                f"From aggregator ({age:.0f}s old): {data['status']} • Will apply on next loop • Esc/Ctrl+Q to close"
+            )
 
     def color_for_sev(sev: int) -> str:
         if sev == ui.SEV_OUTAGE:
@@ -189,114 +224,58 @@ class TickerOverlay(tk.Tk):
             return ui.COLOR_DEGRADED
         return ui.COLOR_OK
 
-    def _layout_segments_off_right(self, segs):
-        self._clear_items()
-
-        w = max(self.canvas.winfo_width(), 1)
-        x = w + 10
-        y = (ui.BAR_HEIGHT // 2) - 6  # visually centered-ish
-
-        for idx, seg in enumerate(segs):
-            if idx > 0:
-                sep_id = self.canvas.create_text(
-                    x, y, text=ui.SEP, fill='white', font=self.ticker_font, anchor="w"
-                )
-                self.items.append({"id": sep_id, "kind": "sep", "url": None})
-                x = self.canvas.bbox(sep_id)[2] + 2
-
-            txt = seg["text"]
-            sev = seg["sev"]
-            url = seg["url"]
-            clickable = seg["clickable"]
-
-            fill = statusSources.color_for_sev(sev)
-            font_used = self.ticker_font_u if clickable else self.ticker_font
-
-            item_id = self.canvas.create_text(
-                x, y, text=txt, fill=fill, font=font_used, anchor="w"
-            )
-            self.items.append({"id": item_id, "kind": "seg", "url": url})
-
-            if clickable and url:
-                self._bind_click(item_id, url)
-
-            x = self.canvas.bbox(item_id)[2] + 2
-
-    def _apply_pending_if_any(self):
-        with self._lock:
-            segs = self._pending_segments
-            self._pending_segments = None
-
-        if segs is not None:
-            self._layout_segments_off_right(segs)
-
-    def _apply_pending_now_if_empty(self):
-        # Only used to draw the very first time so the bar isn't blank
-        if self._closing or self.items:
+    # ----------------------------
+    # CLOCK
+    # ----------------------------
+    # One after() loop drives every bar. It runs every _frame_ms while any bar
+    # scrolls and drops to IDLE_CHECK_MS when none does (all static or
+    # suspended); new segments wake it straight away.
+    def _animate(self):
+        if self._closing:
             return
 
-        with self._lock:
-            segs = self._pending_segments
-            self._pending_segments = None
+        if ui.SUSPEND_WHEN_HIDDEN:
+            now = time.monotonic()
+            if now - self._suspend_checked >= ui.SUSPEND_CHECK_MS / 1000:
+                self._suspend_checked = now
+                self._update_suspended()
 
-        if segs is not None:
-            self._layout_segments_off_right(segs)
+        t0 = time.perf_counter()
+        moving = self._animate_frame()
+        metrics.observe("ticker_animate_seconds", time.perf_counter() - t0)
 
+        self._clock_idle = not moving
+        if not moving:
+            self._last_frame = None  # resume without a catch-up jump
+        self._animate_job = self.after(self._frame_ms if moving else ui.IDLE_CHECK_MS, self._animate)
 
+    def _wake_clock(self):
+        if self._clock_idle and not self._closing:
+            self._clock_idle = False
+            self.after_cancel(self._animate_job)
+            self._animate_job = self.after_idle(self._animate)
 
-    def _animate(self):
-        if self._closing:
-            return
-
-        # If we have no items yet, try to apply pending (bootstrap safety)
-        if not self.items:
-            self._apply_pending_now_if_empty()
-            self.after(ui.TICK_MS, self._animate)
-            return
-
-        # Move all items left smoothly
-        for item in self.items:
-            self.canvas.move(item["id"], -ui.SCROLL_PIXELS_PER_TICK, 0)
-
-        # If everything has scrolled off the left, we are at the natural loop point.
-        rightmost = max(
-            (self.canvas.bbox(item["id"])[2] for item in self.items if self.canvas.bbox(item["id"])),
-            default=0
-        )
-
-        if rightmost < 0:
-            # At loop boundary: apply any pending refresh NOW (no mid-scroll jump)
-            with self._lock:
-                segs = self._pending_segments
-                self._pending_segments = None
-
-            if segs is not None:
-                # Swap in refreshed content
-                self._layout_segments_off_right(segs)
-            else:
-                # No pending update; loop the current content by rebuilding it
-                current = []
-                for item in self.items:
-                    if item["kind"] != "seg":
-                        continue
-                    txt = self.canvas.itemcget(item["id"], "text")
-                    fill = self.canvas.itemcget(item["id"], "fill")
-                    url = item["url"]
-
-                    # infer severity from fill color
-                    sev = statusSources.SEV_OK
-                    if fill.lower() == ui.COLOR_OUTAGE.lower():
-                        sev = statusSources.SEV_OUTAGE
-                    elif fill.lower() == ui.COLOR_DEGRADED.lower():
-                        sev = statusSources.SEV_DEGRADED
-
-                    current.append({
-                        "text": txt,
-                        "sev": sev,
-                        "url": url,
-                        "clickable": bool(url),
-                    })
-
-                self._layout_segments_off_right(current)
-
-        self.after(ui.TICK_MS, self._animate)
\ No newline at end of file
+    def _update_suspended(self):
+        try:
+            locked = windowsAppBar.session_locked()
+        except Exception:
+            locked = False
+        for bar in self.bars:
+            bar.update_suspended(locked)
+
+    def _animate_frame(self) -> bool:
+        # Distance comes from real elapsed time, so a late after() doesn't slow the text.
+        # Clamp so a stall (sleep, debugger, window drag) doesn't teleport the strip.
+        now = time.monotonic()
+        if self._last_frame is None:
+            dt = 0.0
+        else:
+            interval = now - self._last_frame
+            metrics.observe("ticker_frame_interval_jitter_seconds", abs(interval - self._frame_ms / 1000))
+            dt = min(interval, ui.MAX_FRAME_GAP_SECONDS)
+        self._last_frame = now
+
+        # One clock for every bar: each moves by the same distance this frame.
+        # Returns True while any bar still needs frames.
+        dx = ui.SCROLL_PIXELS_PER_SECOND * dt
+        return any([bar.frame(dx) for bar in self.bars])
@@ -3,7 +3,9 @@
 # ----------------------------
 REFRESH_EVERY_SECONDS = 60
 SCROLL_PIXELS_PER_TICK = 1
-TICK_MS = 10
+TICK_MS = 10             # with SCROLL_PIXELS_PER_TICK, sets the speed; frame pacing: see FRAME RATE
+SCROLL_PIXELS_PER_SECOND = SCROLL_PIXELS_PER_TICK * 1000 / TICK_MS  # motion is time-based
+MAX_FRAME_GAP_SECONDS = 0.25  # cap on one frame's movement after a stall
 TIMEOUT = 12
 
 BAR_HEIGHT = 46          # height of the always-on-top bar
@@ -14,6 +16,89 @@ COLOR_OUTAGE = "#ff4d4d"     # red
 COLOR_LINK_HINT = "#7aa7ff"  # subtle blue hint for clickable items (optional)
 
 SEP = "   |   "
+SEGMENT_MAX_WIDTH_PX = 900  # longer entries are cut short with "…"; None = no limit
 
+# "text": Tk draws each text item every frame (default)
+# "bitmap": the strip is pre-rendered into one image per content change and only
+#           that image moves; cheaper on low-end machines. Needs Pillow
+#           (pip install pillow); falls back to "text" without it.
+RENDER_MODE = "text"
+BITMAP_FONT_FILE = "segoeuib.ttf"  # Segoe UI Bold, same face as text mode
+
+# "one": a bar on MONITOR_INDEX only
+# "all": a bar on every monitor, all fed by one refresh pipeline and one animation clock
+MONITORS = "one"
 MONITOR_INDEX = 0  # 0 = leftmost monitor, 1 = next, etc.
-RESERVE_SPACE_FOR_MAXIMIZE = True
\ No newline at end of file
+RESERVE_SPACE_FOR_MAXIMIZE = True
+
+# Shared aggregator (run one with: py main.py --serve). When set, the overlay
+# gets its segments from there instead of polling every provider itself.
+AGGREGATOR_URL = None  # e.g. "http://status-agg.school.local:8765"
+
+# Metrics (Prometheus text format): per-provider fetch latency/bytes/parse time/
+# errors/data age, plus frame jitter and time in _animate / layout.
+METRICS_PORT = None               # e.g. 9464 -> http://127.0.0.1:9464/metrics
+METRICS_FILE = None               # e.g. r"C:\ProgramData\StatusTicker\ticker.prom" (node_exporter textfile)
+METRICS_FILE_EVERY_SECONDS = 15
+
+# ----------------------------
+# FRAME RATE
+# ----------------------------
+# A frame runs every max(1 / display refresh, 1 / SCROLL_PIXELS_PER_SECOND)
+# seconds: never faster than the screen can show, nor faster than whole-pixel steps.
+DISPLAY_HZ = None            # None = ask Windows (60 if it won't say)
+# Content that fits the bar scrolls in once and then stays put (no frames at all)
+STATIC_WHEN_FITS = True
+STATIC_X = 10                # left edge of the static strip
+# No frames while the session is locked, or a bar's monitor has a fullscreen
+# window over it / the bar is minimized; checked every SUSPEND_CHECK_MS
+SUSPEND_WHEN_HIDDEN = True
+SUSPEND_CHECK_MS = 1000
+IDLE_CHECK_MS = 500          # clock rate while no bar is scrolling
+
+# ----------------------------
+# POLLING (per provider)
+# ----------------------------
+POLL_CHECK_MS = 1000            # how often the overlay asks the scheduler what's due
+POLL_STABLE_MAX_SECONDS = 300   # "Operational" providers slow down toward this
+POLL_STABLE_GROWTH = 1.5        # interval multiplier per consecutive OK poll
+POLL_INCIDENT_SECONDS = 20      # while degraded/outage
+POLL_BACKOFF_MAX_SECONDS = 900  # cap for exponential backoff after errors
+POLL_JITTER = 0.15              # +/- fraction so a fleet doesn't poll in lockstep
+# One refresh thread; its results reach the Tk loop through a queue drained
+# this often, at most UI_QUEUE_BATCH messages per pass
+UI_QUEUE_DRAIN_MS = 50
+UI_QUEUE_BATCH = 100
+
+# ----------------------------
+# CIRCUIT BREAKER (per provider)
+# ----------------------------
+# After BREAKER_FAILURES failed polls in a row a provider is retried no more
+# often than every BREAKER_COOLDOWN_SECONDS, a refresh waits only
+# BREAKER_TRIAL_SECONDS for each retry (a slower answer, within TIMEOUT, still
+# closes the breaker at the next refresh), and its last good entry stays up
+# marked "(as of HH:MM)".
+# The cooldown is a floor on the error backoff, which by then is already
+# REFRESH_EVERY_SECONDS * 2^BREAKER_FAILURES (480 s with the defaults), so it
+# only does something above that; it is capped at POLL_BACKOFF_MAX_SECONDS.
+BREAKER_FAILURES = 3
+BREAKER_COOLDOWN_SECONDS = 900
+BREAKER_TRIAL_SECONDS = 4
+
+# ----------------------------
+# WARM START
+# ----------------------------
+# The last good segments are saved to last_status.json (see Utility/appPaths.py)
+# and drawn at launch, marked "(as of HH:MM)", until the first live refresh lands.
+WARM_START = True
+SNAPSHOT_MAX_AGE_HOURS = 72       # older snapshots are ignored
+SNAPSHOT_SAVE_EVERY_SECONDS = 300  # re-save unchanged content so its "as of" time stays current
+
+# ----------------------------
+# HISTORY
+# ----------------------------
+# State transitions (not every poll) are logged to history.sqlite3 next to the
+# snapshot; `py main.py --history` prints time degraded/down per provider.
+HISTORY_ENABLED = True
+HISTORY_DETAIL_DAYS = 30   # older rows keep only severity changes
+HISTORY_KEEP_DAYS = 730    # older rows are dropped
@@ -0,0 +1,158 @@
+"""
+Shared status aggregator.
+
+One headless process runs the statusSources fetchers (through StatusPipeline,
+so it keeps the per-provider cadence) and serves the merged segment list to any
+number of overlays on the local network:
+
+    GET /segments                      -> current list immediately
+    GET /segments?since=<v>&wait=<s>   -> long-poll: answers as soon as the
+                                          version differs from <v>, or after <s> seconds
+    GET /metrics                       -> Prometheus text (Utility.metrics)
+
+Response: {"version": int, "updated": unix time, "segments": [...], "status": str}
+
+Upstream load stays one poller per site regardless of how many screens connect.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from Utility import metrics
+from Utility.statusPipeline import StatusPipeline, describe
+
+DEFAULT_PORT = 8765
+MAX_WAIT_SECONDS = 55  # long-poll cap; keeps under common proxy idle timeouts
+CHECK_SECONDS = 1.0
+
+
+class AggregatorState:
+    """Latest published segments + a condition clients long-poll on."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.version = 0
+        self.updated = 0.0
+        self.segments = []
+        self.status = "Starting…"
+
+    def publish(self, segments, status: str):
+        with self._cond:
+            self.version += 1
+            self.updated = time.time()
+            self.segments = segments
+            self.status = status
+            self._cond.notify_all()
+
+    def set_status(self, status: str):
+        with self._cond:
+            self.status = status
+
+    def snapshot(self, since: int | None = None, wait: float = 0.0) -> dict:
+        with self._cond:
+            if since is not None and wait > 0:
+                # "differs" rather than "newer" so clients recover when the aggregator restarts
+                self._cond.wait_for(lambda: self.version != since, timeout=wait)
+            return {"version": self.version, "updated": self.updated,
+                    "segments": self.segments, "status": self.status}
+
+
+def poll_forever(state: AggregatorState, pipeline: StatusPipeline, stop: threading.Event):
+    """Background loop: fetch whatever the scheduler says is due, publish on success."""
+    while not stop.is_set():
+        due = pipeline.claim_due()
+        if due:
+            try:
+                report = pipeline.refresh(due)
+                if report["changed"]:
+                    state.publish(report["segments"], describe(report, due))
+                else:
+                    state.set_status(describe(report, due))  # no new version: long-polls keep waiting
+            except Exception as e:
+                state.set_status(f"Refresh failed: {e!r}")
+        stop.wait(CHECK_SECONDS)
+
+
+def _make_handler(state: AggregatorState):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.rstrip("/") == "/metrics":
+                self._send(metrics.render().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+                return
+            if url.path.rstrip("/") != "/segments":
+                self.send_error(404)
+                return
+
+            q = parse_qs(url.query)
+            try:
+                since = int(q["since"][0]) if "since" in q else None
+                wait = min(float(q.get("wait", ["0"])[0]), MAX_WAIT_SECONDS)
+            except ValueError:
+                self.send_error(400, "since/wait must be numbers")
+                return
+
+            self._send(json.dumps(state.snapshot(since, wait)).encode("utf-8"), "application/json")
+
+        def _send(self, body: bytes, content_type: str):
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass  # one line per long-poll would flood the console
+
+    return Handler
+
+
+def serve(host: str = "0.0.0.0", port: int = DEFAULT_PORT):
+    """Runs the aggregator until Ctrl+C."""
+    state = AggregatorState()
+    stop = threading.Event()
+    pipeline = StatusPipeline()
+
+    warm = pipeline.warm_start()
+    if warm:
+        state.publish(warm, "Last known status (stale), refreshing…")
+    threading.Thread(target=poll_forever, args=(state, pipeline, stop), daemon=True).start()
+
+    server = ThreadingHTTPServer((host, port), _make_handler(state))
+    server.daemon_threads = True
+    print(f"Status aggregator on http://{host}:{port}/segments (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+
+
+class AggregatorClient:
+    """Overlay side: long-polls an aggregator for new segment lists."""
+
+    def __init__(self, base_url: str):
+        self.url = base_url.rstrip("/") + "/segments"
+        self.version = None
+
+    def wait_for_change(self, wait: float = MAX_WAIT_SECONDS) -> dict | None:
+        """
+        Blocks up to `wait` seconds for a newer version than the last one seen.
+        Returns the aggregator's response dict, or None if nothing changed.
+        """
+        import requests
+
+        params = {} if self.version is None else {"since": self.version, "wait": wait}
+        r = requests.get(self.url, params=params, timeout=wait + 10)
+        r.raise_for_status()
+        data = r.json()
+
+        if data["version"] == self.version:
+            return None
+        self.version = data["version"]
+        return data
@@ -0,0 +1,20 @@
+import os
+
+
+APP_DIR_NAME = "StatusTicker"
+
+
+def data_dir() -> str:
+    """
+    Per-user folder for caches/snapshots.
+    %LOCALAPPDATA%\\StatusTicker on Windows, ~/.cache/StatusTicker elsewhere.
+    Created on first use.
+    """
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = os.path.join(base, APP_DIR_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def data_file(name: str) -> str:
+    return os.path.join(data_dir(), name)
@@ -0,0 +1,52 @@
+"""
+Per-provider circuit breakers for StatusPipeline.
+
+A provider's breaker opens after BREAKER_FAILURES consecutive failed polls and
+closes on its next success. While it is open:
+  - the provider is polled no sooner than BREAKER_COOLDOWN_SECONDS apart
+    (StatusPipeline passes the cooldown to the PollScheduler as a floor on
+    its error backoff, so it only matters when longer than that backoff);
+  - a refresh waits only BREAKER_TRIAL_SECONDS for each retry, so a
+    hard-down site doesn't hold it for the full TIMEOUT; the fetch itself
+    keeps its TIMEOUT, and a late success is recorded by the next refresh;
+  - the ticker keeps its last good segment, marked stale.
+"""
+import threading
+import time
+
+import GUI.uiConfig as ui
+from Utility import metrics
+
+
+class CircuitBreakers:
+    """Thread-safe; one breaker per provider name."""
+
+    def __init__(self, names, failures: int = ui.BREAKER_FAILURES, cooldown: float = ui.BREAKER_COOLDOWN_SECONDS):
+        self._threshold = failures
+        self.cooldown = float(cooldown)
+        self._lock = threading.Lock()
+        self._failures = {name: 0 for name in names}
+        self._opened = {}  # provider -> unix time its breaker opened
+
+    def is_open(self, name: str) -> bool:
+        with self._lock:
+            return name in self._opened
+
+    def open_names(self) -> list[str]:
+        with self._lock:
+            return list(self._opened)
+
+    def record_success(self, name: str):
+        with self._lock:
+            self._failures[name] = 0
+            if self._opened.pop(name, None) is not None:
+                metrics.set_gauge("ticker_breaker_open", 0, provider=name)
+
+    def record_failure(self, name: str) -> bool:
+        """Counts a failed poll. Returns True if the breaker is open afterwards."""
+        with self._lock:
+            self._failures[name] = self._failures.get(name, 0) + 1
+            if name not in self._opened and self._failures[name] >= self._threshold:
+                self._opened[name] = time.time()
+                metrics.set_gauge("ticker_breaker_open", 1, provider=name)
+            return name in self._opened
@@ -0,0 +1,62 @@
+import re
+from functools import lru_cache
+
+
+CACHE_SIZE = 4096
+
+
+def normalize(phrase: str) -> str:
+    # lowercase phrases match any case; phrases containing capitals ("US") match exactly
+    p = " ".join(phrase.split())
+    return p if p != p.lower() else p.lower()
+
+
+def compile_needles(needles) -> re.Pattern:
+    """
+    One regex matching any of the normalized `needles` as a whole word/phrase,
+    tried in the order given (put longer ones first so "major outage" wins over
+    "outage"). Group "n<i>" is the i-th needle, so m.lastgroup says which one
+    matched: the matched text can't be mapped back by lowercasing it, because
+    IGNORECASE also matches Unicode case variants ("uſa" for "usa").
+    Boundaries are "not a letter/digit" rather than \\b, so needles like
+    "u.s." still work. Lowercase needles are case-insensitive; needles with
+    capitals are exact.
+    """
+    def alt(w):
+        body = re.escape(w).replace(r"\ ", r"\s+")
+        return body if w == w.lower() else f"(?-i:{body})"
+
+    alts = "|".join(f"(?P<n{i}>{alt(w)})" for i, w in enumerate(needles))
+    return re.compile(rf"(?<![a-z0-9])(?:{alts})(?![a-z0-9])", re.IGNORECASE)
+
+
+class KeywordClassifier:
+    """
+    Tags text with every category whose phrases occur in it, in a single regex
+    pass regardless of how many phrases there are.
+
+        c = KeywordClassifier({"outage": ["outage", "down"], "us": ["usa", "u.s."]})
+        c.classify("USA: email down")  ->  frozenset({"outage", "us"})
+
+    Results are memoized per text (LRU, CACHE_SIZE entries), so re-classifying
+    an unchanged feed entry costs one dict lookup.
+    """
+
+    def __init__(self, categories: dict, cache_size: int = CACHE_SIZE):
+        self._tags = {}  # normalized phrase -> set of categories
+        for cat, phrases in categories.items():
+            for p in phrases:
+                key = normalize(p)
+                if key:
+                    self._tags.setdefault(key, set()).add(cat)
+
+        phrases = sorted(self._tags, key=len, reverse=True)
+        self._pattern = compile_needles(phrases)
+        self._group_tags = {f"n{i}": frozenset(self._tags[p]) for i, p in enumerate(phrases)}
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _classify(self, text: str) -> frozenset:
+        found = set()
+        for m in self._pattern.finditer(text or ""):
+            found |= self._group_tags[m.lastgroup]
+        return frozenset(found)
@@ -0,0 +1,184 @@
+"""
+Incident history: an append-only SQLite log of provider state transitions.
+
+Only changes are stored: a row is written when a provider's severity or
+incident text differs from its previous row, never per poll. Timelines and
+durations are computed from consecutive rows, using the (provider, at) index.
+
+    h = IncidentHistory()
+    h.record("Google Workspace", seg)                 # from StatusPipeline.refresh()
+    h.durations("Google Workspace", since=week_ago)   # {sev: seconds}
+    h.timeline("Google Workspace", since=week_ago)    # [(start, end, sev, text), ...]
+    h.flapping(since=day_ago, min_changes=6)          # [(provider, severity changes), ...]
+
+compact() bounds growth: rows older than HISTORY_DETAIL_DAYS keep only
+severity changes (text-only updates are merged away), rows older than
+HISTORY_KEEP_DAYS are dropped, and the last row before the cutoff survives
+so the state at the cutoff is still known.
+"""
+import sqlite3
+import threading
+import time
+
+import GUI.uiConfig as ui
+from Utility import appPaths
+
+HISTORY_FILE_NAME = "history.sqlite3"
+COMPACT_EVERY_SECONDS = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transitions (
+    id       INTEGER PRIMARY KEY,
+    provider TEXT    NOT NULL,
+    at       REAL    NOT NULL,  -- unix time the new state was first seen
+    sev      INTEGER NOT NULL,
+    text     TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transitions_provider_at ON transitions (provider, at);
+CREATE INDEX IF NOT EXISTS transitions_at ON transitions (at);
+"""
+
+
+class IncidentHistory:
+    """Thread-safe; one connection shared by the refresh workers."""
+
+    def __init__(self, path: str | None = None):
+        self._path = path
+        self._db = None
+        self._last = {}  # provider -> (sev, text) of its newest row
+        self._compacted_at = 0.0
+        self._lock = threading.Lock()
+
+    def _conn(self):
+        # caller holds _lock
+        if self._db is None:
+            if self._path is None:
+                self._path = appPaths.data_file(HISTORY_FILE_NAME)
+            self._db = sqlite3.connect(self._path, check_same_thread=False)
+            self._db.executescript(_SCHEMA)
+            rows = self._db.execute(
+                "SELECT provider, sev, text FROM transitions t "
+                "WHERE at = (SELECT MAX(at) FROM transitions WHERE provider = t.provider)"
+            )
+            self._last = {provider: (sev, text) for provider, sev, text in rows}
+        return self._db
+
+    # ---- writing ----
+    def record(self, provider: str, seg: dict, at: float | None = None) -> bool:
+        """Stores the segment's state if it differs from the provider's last one. Returns True if written."""
+        state = (int(seg["sev"]), seg["text"])
+        if at is None:
+            at = seg.get("fetched") or time.time()
+        with self._lock:
+            db = self._conn()
+            if self._last.get(provider) == state:
+                return False
+            with db:
+                db.execute("INSERT INTO transitions (provider, at, sev, text) VALUES (?, ?, ?, ?)",
+                           (provider, at, state[0], state[1]))
+            self._last[provider] = state
+
+            if at - self._compacted_at >= COMPACT_EVERY_SECONDS:
+                self._compact(at)
+        return True
+
+    def compact(self, now: float | None = None):
+        with self._lock:
+            self._compact(time.time() if now is None else now)
+
+    def _compact(self, now: float):
+        # caller holds _lock
+        db = self._conn()
+        self._compacted_at = now
+        keep_from = now - ui.HISTORY_KEEP_DAYS * 86400
+        detail_from = now - ui.HISTORY_DETAIL_DAYS * 86400
+
+        with db:
+            # drop expired rows, except each provider's last one before the cutoff
+            db.execute(
+                "DELETE FROM transitions WHERE at < ? AND id NOT IN ("
+                " SELECT id FROM transitions t WHERE at = ("
+                "  SELECT MAX(at) FROM transitions WHERE provider = t.provider AND at < ?))",
+                (keep_from, keep_from),
+            )
+            # past the detail window, merge rows that only changed the text
+            db.execute(
+                "DELETE FROM transitions WHERE id IN ("
+                " SELECT id FROM ("
+                "  SELECT id, at, sev, LAG(sev) OVER (PARTITION BY provider ORDER BY at) AS prev_sev"
+                "  FROM transitions)"
+                " WHERE at < ? AND sev = prev_sev)",
+                (detail_from,),
+            )
+        db.execute("PRAGMA optimize")
+
+    # ---- queries ----
+    def timeline(self, provider: str, since: float = 0.0, until: float | None = None):
+        """
+        [(start, end, sev, text), ...] covering [since, until] (default: now),
+        oldest first. The state already active at `since` starts the list.
+        """
+        until = time.time() if until is None else until
+        with self._lock:
+            db = self._conn()
+            before = db.execute(
+                "SELECT at, sev, text FROM transitions WHERE provider = ? AND at <= ? "
+                "ORDER BY at DESC LIMIT 1", (provider, since)
+            ).fetchall()
+            rows = before + db.execute(
+                "SELECT at, sev, text FROM transitions WHERE provider = ? AND at > ? AND at < ? "
+                "ORDER BY at", (provider, since, until)
+            ).fetchall()
+
+        spans = []
+        for i, (at, sev, text) in enumerate(rows):
+            end = rows[i + 1][0] if i + 1 < len(rows) else until
+            spans.append((max(at, since), end, sev, text))
+        return spans
+
+    def durations(self, provider: str, since: float = 0.0, until: float | None = None) -> dict:
+        """{sev: seconds} spent in each severity over [since, until]."""
+        totals = {}
+        for start, end, sev, _ in self.timeline(provider, since, until):
+            totals[sev] = totals.get(sev, 0.0) + (end - start)
+        return totals
+
+    def flapping(self, since: float, min_changes: int = 6):
+        """Providers whose severity changed at least `min_changes` times since `since`, busiest first."""
+        with self._lock:
+            rows = self._conn().execute(
+                "SELECT provider, COUNT(*) FROM ("
+                " SELECT provider, at, sev, LAG(sev) OVER (PARTITION BY provider ORDER BY at) AS prev_sev"
+                " FROM transitions)"
+                " WHERE at >= ? AND prev_sev IS NOT NULL AND sev != prev_sev"
+                " GROUP BY provider HAVING COUNT(*) >= ? ORDER BY COUNT(*) DESC",
+                (since, min_changes),
+            ).fetchall()
+        return rows
+
+    def providers(self) -> list[str]:
+        with self._lock:
+            return [p for (p,) in self._conn().execute("SELECT DISTINCT provider FROM transitions ORDER BY provider")]
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def report(days: float = 7.0, history: IncidentHistory | None = None) -> str:
+    """Plain-text summary for `main.py --history`: time degraded/down per provider, and flapping."""
+    from Utility.statusSources import SEV_DEGRADED, SEV_OUTAGE
+
+    history = history or IncidentHistory()
+    since = time.time() - days * 86400
+    lines = [f"Last {days:g} days:"]
+    for provider in history.providers():
+        d = history.durations(provider, since)
+        lines.append(f"  {provider:<24} degraded {d.get(SEV_DEGRADED, 0) / 3600:7.1f} h"
+                     f"   outage {d.get(SEV_OUTAGE, 0) / 3600:7.1f} h")
+    flaps = history.flapping(since)
+    if flaps:
+        lines.append("Flapping: " + ", ".join(f"{p} ({n} changes)" for p, n in flaps))
+    return "\n".join(lines)
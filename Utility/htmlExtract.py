@@ -0,0 +1,97 @@
+import codecs
+from html.parser import HTMLParser
+
+
+# Content of these never reaches the visible page text
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "head"}
+
+
+class KeywordLineExtractor(HTMLParser):
+    """
+    Streaming tokenizer that keeps only visible text lines containing one of
+    `keywords` (lowercase). No tree is built and non-matching text is dropped
+    as soon as it is seen, so cost is one pass over the bytes.
+
+    Lines match what BeautifulSoup's get_text("\\n").splitlines() would give,
+    stripped and without blanks.
+
+    feed() hands a text node over in pieces when it crosses a chunk boundary,
+    so text is buffered and only checked once the node ends (next tag,
+    comment or close()).
+    """
+
+    def __init__(self, keywords):
+        super().__init__(convert_charrefs=True)
+        self.keywords = tuple(keywords)
+        self.lines = []
+        self._skip_depth = 0
+        self._text = []  # pieces of the current text node
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()  # <br/>, <img/> etc. never open a skipped region
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._text.append(data)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def _flush(self):
+        if not self._text:
+            return
+        data = "".join(self._text)
+        self._text = []
+        # cheap reject before splitting: most text nodes mention none of the keywords
+        low = data.lower()
+        if not any(k in low for k in self.keywords):
+            return
+        for ln in data.splitlines():
+            ln = ln.strip()
+            if ln and any(k in ln.lower() for k in self.keywords):
+                self.lines.append(ln)
+
+
+class ExtractError(Exception):
+    """The tokenizer gave up on the page (not the download: errors from `chunks` pass through)."""
+
+
+def extract_lines(chunks, keywords, encoding: str = "utf-8"):
+    """
+    Feeds byte `chunks` through a KeywordLineExtractor and returns the matching lines.
+    Raises ExtractError if the tokenizer fails; anything `chunks` raises
+    (network errors, DownloadRejected) propagates unchanged.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    parser = KeywordLineExtractor(keywords)
+
+    for chunk in chunks:
+        _feed(parser, decoder.decode, chunk)
+    _feed(parser, decoder.decode, b"", final=True)
+    try:
+        parser.close()
+    except Exception as e:
+        raise ExtractError(f"tokenizer failed: {e!r}") from e
+
+    return parser.lines
+
+
+def _feed(parser, decode, chunk: bytes, final: bool = False):
+    try:
+        parser.feed(decode(chunk, final=final))
+    except Exception as e:
+        raise ExtractError(f"tokenizer failed: {e!r}") from e
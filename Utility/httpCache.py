@@ -0,0 +1,239 @@
+import copy
+import email.utils
+import importlib.util
+import json
+import os
+import re
+import threading
+import time
+
+from Utility import appPaths
+
+
+CACHE_FILE_NAME = "http_cache.json"
+STREAM_CHUNK = 64 * 1024
+
+
+class DownloadRejected(Exception):
+    """A response was refused before/while reading: too large or the wrong content type."""
+
+
+def accept_encoding() -> str:
+    # urllib3 decodes brotli only when a brotli package is installed
+    has_br = importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    return "gzip, deflate, br" if has_br else "gzip, deflate"
+
+
+class _CappedBody:
+    """
+    Stands in for response.raw: counts decoded bytes as the parser pulls them
+    and raises DownloadRejected as soon as they pass `limit`. Everything else
+    (tell(), close(), ...) goes to the real urllib3 response.
+    """
+
+    def __init__(self, raw, limit: int | None, url: str = ""):
+        self._raw = raw
+        self.limit = limit
+        self.url = url
+        self.decoded = 0
+
+    def _count(self, data: bytes) -> bytes:
+        self.decoded += len(data)
+        if self.limit is not None and self.decoded > self.limit:
+            raise DownloadRejected(f"{self.url}: body larger than {self.limit} bytes")
+        return data
+
+    def read(self, amt=None, *args, **kwargs):
+        if amt is None:  # whole body, but still abort at the cap rather than after it
+            return b"".join(self.stream(STREAM_CHUNK))
+        return self._count(self._raw.read(amt, *args, **kwargs))
+
+    def stream(self, amt=STREAM_CHUNK, decode_content=None):
+        for chunk in self._raw.stream(amt, decode_content=decode_content):
+            yield self._count(chunk)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
+class HttpCache:
+    """
+    Conditional-GET cache shared by the status fetchers.
+
+    Per URL it remembers the ETag / Last-Modified validators and the already
+    *parsed* result. The next request sends If-None-Match / If-Modified-Since;
+    on 304 the cached result is returned without touching the parser.
+    Entries are persisted to a small JSON file so restarts stay warm.
+
+    Each entry also records the caller's `parser_key`; an entry stored under a
+    different key (provider renamed, parser options or code changed) is a
+    miss, so the body is fetched and parsed again.
+    """
+
+    def __init__(self, path: str | None = None):
+        self._path = path
+        self._entries = None  # loaded lazily: {url: {"etag", "last_modified", "result", "parser", "stored"}}
+        self._last_headers = {}  # url -> headers of the most recent response (any status)
+        self._last_stats = {}    # url -> {"bytes", "decoded_bytes", "parse_seconds", "not_modified"} of the most recent fetch
+        self._lock = threading.Lock()
+
+    # ---- persistence ----
+    def _file(self) -> str:
+        if self._path is None:
+            self._path = appPaths.data_file(CACHE_FILE_NAME)
+        return self._path
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        try:
+            with open(self._file(), "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def _save(self):
+        path = self._file()
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # cache is best-effort
+
+    # ---- public ----
+    def get(self, url: str, parse, timeout: float, max_bytes: int | None = None, content_types=(),
+            parser_key: str | None = None):
+        """
+        GET `url`; returns parse(response), or the cached parse result on 304.
+        `parse` must return something JSON-serializable. The response is
+        streamed and closed afterwards, so `parse` may stop reading r.raw early.
+        `parser_key` identifies what `parse` does; a cached result stored under
+        another key is not reused (and its validators are not sent).
+
+        Bodies are requested compressed (gzip/deflate, plus brotli when
+        available). Raises DownloadRejected, before or while reading, when
+        the body passes `max_bytes` (decoded) or when `content_types` is given
+        and the Content-Type contains none of those substrings.
+        """
+        with self._lock:
+            self._load()
+            entry = self._entries.get(url)
+        if entry and entry.get("parser") != parser_key:
+            entry = None  # parsed differently back then: fetch the full body
+
+        headers = {"Accept-Encoding": accept_encoding()}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        import requests  # deferred: ~100 ms of imports the overlay doesn't need to paint
+
+        # streamed so parsers can read r.raw incrementally and stop early;
+        # r.text / r.json() still work as usual
+        with self._lock:
+            self._last_stats[url] = {}
+
+        with requests.get(url, headers=headers, timeout=timeout, stream=True) as r:
+            r.raw.decode_content = True
+            with self._lock:
+                self._last_headers[url] = dict(r.headers)
+
+            if r.status_code == 304 and entry:
+                with self._lock:
+                    self._last_stats[url] = {"bytes": 0, "parse_seconds": 0.0, "not_modified": True}
+                return copy.deepcopy(entry["result"])
+
+            r.raise_for_status()
+            _check_response(r, url, max_bytes, content_types)
+            r.raw = body = _CappedBody(r.raw, max_bytes, url)
+
+            t0 = time.perf_counter()
+            result = parse(r)
+            parse_seconds = time.perf_counter() - t0
+
+            with self._lock:
+                # "bytes" as read off the wire (compressed), "decoded_bytes" as handed to the
+                # parser; both only what the parser consumed
+                self._last_stats[url] = {"bytes": body.tell(), "decoded_bytes": body.decoded,
+                                         "parse_seconds": parse_seconds, "not_modified": False}
+
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        with self._lock:
+            if etag or last_modified:
+                self._entries[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "result": copy.deepcopy(result),
+                    "parser": parser_key,
+                    "stored": time.time(),
+                }
+                self._save()
+            elif self._entries.pop(url, None) is not None:
+                self._save()
+
+        return result
+
+    def poll_hint(self, url: str) -> float | None:
+        """
+        Seconds the server asked us to wait before the next request, from the
+        last response's Retry-After or Cache-Control max-age. None if neither.
+        """
+        with self._lock:
+            headers = self._last_headers.get(url) or {}
+        return poll_hint_from_headers(headers)
+
+    def last_stats(self, url: str) -> dict:
+        """{"bytes", "decoded_bytes", "parse_seconds", "not_modified"} of the last fetch of `url`; {} if it failed early."""
+        with self._lock:
+            return dict(self._last_stats.get(url) or {})
+
+    def forget_stats(self, urls):
+        """Drops last_stats() for `urls`, so a URL not requested this round reports {}."""
+        with self._lock:
+            for url in urls:
+                self._last_stats.pop(url, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+
+def _check_response(r, url: str, max_bytes: int | None, content_types):
+    # cheap header checks before a byte of the body is read
+    ctype = (r.headers.get("Content-Type") or "").lower()
+    if content_types and ctype and not any(t in ctype for t in content_types):
+        raise DownloadRejected(f"{url}: unexpected Content-Type {ctype!r} (captive portal?)")
+
+    length = r.headers.get("Content-Length")
+    # Content-Length is the encoded size; if even that is over, the decoded body is too
+    if max_bytes is not None and length and length.isdigit() and int(length) > max_bytes:
+        raise DownloadRejected(f"{url}: Content-Length {length} over the {max_bytes}-byte cap")
+
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.I)
+
+
+def poll_hint_from_headers(headers: dict) -> float | None:
+    # header names are case-insensitive; plain dicts aren't
+    h = {k.lower(): v for k, v in headers.items()}
+
+    retry_after = (h.get("retry-after") or "").strip()
+    if retry_after:
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            when = email.utils.parsedate_to_datetime(retry_after)
+            return max(0.0, when.timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+
+    m = _MAX_AGE_RE.search(h.get("cache-control") or "")
+    if m:
+        return float(m.group(1))
+    return None
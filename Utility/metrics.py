@@ -0,0 +1,176 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+    metrics.inc("ticker_fetch_errors_total", provider="Cloudflare")
+    metrics.observe("ticker_fetch_seconds", 0.42, provider="Cloudflare")
+    metrics.set_gauge("ticker_last_success_timestamp_seconds", time.time(), provider="Cloudflare")
+
+Exposed either at http://127.0.0.1:<port>/metrics (start_http) or as a file
+rewritten every few seconds (start_file_writer), suitable for the node_exporter
+textfile collector. Recording is a dict update under a lock; nothing is
+exported unless one of those is started.
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# seconds; covers a 1 ms frame up to a 12 s fetch timeout
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20)
+
+HELP = {
+    "ticker_fetch_seconds": "Provider fetch latency (request + parse)",
+    "ticker_parse_seconds": "Time spent in the provider parser (includes streaming the body)",
+    "ticker_bytes_received_total": "Response bytes read from the network (compressed)",
+    "ticker_bytes_decoded_total": "Response bytes after decompression, as handed to the parser",
+    "ticker_fetch_errors_total": "Failed or timed-out provider fetches",
+    "ticker_breaker_open": "1 while the provider's circuit breaker is open (serving its last good data)",
+    "ticker_not_modified_total": "Fetches answered 304 from the response cache",
+    "ticker_html_fallbacks_total": "HTML pages re-fetched for the full scrape after the streaming tokenizer failed",
+    "ticker_entries_total": "Feed entries/incidents per parse, classified anew or reused by id + update stamp",
+    "ticker_last_success_timestamp_seconds": "Unix time of the provider's last good data",
+    "ticker_data_age_seconds": "Age of the provider's last good data",
+    "ticker_frame_interval_jitter_seconds": "|actual frame interval - target frame interval|",
+    "ticker_animate_seconds": "Time spent in one _animate frame",
+    "ticker_layout_seconds": "Layout work per content change: measure (text widths), build (new lap), patch (reused lap)",
+}
+
+_lock = threading.Lock()
+_counters = {}    # (name, labels) -> float
+_gauges = {}      # (name, labels) -> float
+_histograms = {}  # (name, labels) -> [bucket counts..., +Inf count, sum]
+
+
+def _key(name: str, labels: dict):
+    return name, tuple(sorted(labels.items()))
+
+
+def inc(name: str, amount: float = 1.0, **labels):
+    k = _key(name, labels)
+    with _lock:
+        _counters[k] = _counters.get(k, 0.0) + amount
+
+
+def set_gauge(name: str, value: float, **labels):
+    with _lock:
+        _gauges[_key(name, labels)] = float(value)
+
+
+def observe(name: str, value: float, **labels):
+    k = _key(name, labels)
+    i = bisect_left(DEFAULT_BUCKETS, value)
+    with _lock:
+        h = _histograms.get(k)
+        if h is None:
+            h = _histograms[k] = [0] * (len(DEFAULT_BUCKETS) + 1) + [0.0]
+        h[i] += 1
+        h[-1] += value
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _histograms.clear()
+
+
+def _escape(v) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def render() -> str:
+    """Current metrics in Prometheus text format (0.0.4)."""
+    now = time.time()
+    with _lock:
+        counters = dict(_counters)
+        gauges = dict(_gauges)
+        hists = {k: list(v) for k, v in _histograms.items()}
+
+    # derived: age of last good data per provider
+    for (name, labels), ts in list(gauges.items()):
+        if name == "ticker_last_success_timestamp_seconds":
+            gauges[("ticker_data_age_seconds", labels)] = max(0.0, now - ts)
+
+    lines = []
+
+    def header(name, kind):
+        if name in HELP:
+            lines.append(f"# HELP {name} {HELP[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    for kind, series in (("counter", counters), ("gauge", gauges)):
+        for name in sorted({n for n, _ in series}):
+            header(name, kind)
+            for (n, labels), v in sorted(series.items()):
+                if n == name:
+                    lines.append(f"{name}{_fmt_labels(labels)} {v:.15g}")
+
+    for name in sorted({n for n, _ in hists}):
+        header(name, "histogram")
+        for (n, labels), h in sorted(hists.items()):
+            if n != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(DEFAULT_BUCKETS, h):
+                cumulative += count
+                lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', bound)])} {cumulative}")
+            cumulative += h[len(DEFAULT_BUCKETS)]
+            lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', '+Inf')])} {cumulative}")
+            lines.append(f"{name}_sum{_fmt_labels(labels)} {h[-1]:.15g}")
+            lines.append(f"{name}_count{_fmt_labels(labels)} {cumulative}")
+
+    return "\n".join(lines) + "\n"
+
+
+def start_http(port: int, host: str = "127.0.0.1"):
+    """Serves /metrics from a daemon thread. Returns the server."""
+    # deferred: http.server drags in http.client/ssl, which the overlay doesn't otherwise need
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0].rstrip("/") != "/metrics":
+                self.send_error(404)
+                return
+            body = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics-http").start()
+    return server
+
+
+def write_file(path: str):
+    # atomic replace, so a scraper never reads half a file
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(tmp, path)
+
+
+def start_file_writer(path: str, every_seconds: float = 15.0):
+    """Rewrites `path` with the current metrics every `every_seconds` from a daemon thread."""
+    def loop():
+        while True:
+            try:
+                write_file(path)
+            except OSError:
+                pass
+            time.sleep(every_seconds)
+
+    threading.Thread(target=loop, daemon=True, name="metrics-file").start()
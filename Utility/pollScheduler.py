@@ -0,0 +1,75 @@
+import random
+import threading
+import time
+
+import GUI.uiConfig as ui
+from Utility.statusSources import SEV_OK
+
+
+class PollScheduler:
+    """
+    Per-provider polling cadence.
+
+    - Operational: interval grows by POLL_STABLE_GROWTH per OK poll, up to POLL_STABLE_MAX_SECONDS
+    - Degraded/outage: POLL_INCIDENT_SECONDS, so recovery/escalation shows up fast
+    - Errors: REFRESH_EVERY_SECONDS * 2^failures, up to POLL_BACKOFF_MAX_SECONDS
+    - Server hints (Retry-After / Cache-Control max-age) are a floor on the next interval
+    - Every interval gets +/- POLL_JITTER so machines drift apart
+
+    All methods are thread-safe; results are recorded from the refresh worker.
+    """
+
+    def __init__(self, names, base_seconds: float = ui.REFRESH_EVERY_SECONDS):
+        self._base = float(base_seconds)
+        self._lock = threading.Lock()
+        now = time.monotonic()
+        self._state = {
+            name: {"due": now, "interval": self._base, "failures": 0, "in_flight": False}
+            for name in names
+        }
+
+    def claim_due(self, now: float | None = None) -> list[str]:
+        """Returns providers whose turn it is and marks them in flight."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            due = [n for n, st in self._state.items() if not st["in_flight"] and st["due"] <= now]
+            for n in due:
+                self._state[n]["in_flight"] = True
+        return due
+
+    def record_success(self, name: str, sev: int, hint: float | None = None):
+        with self._lock:
+            st = self._state[name]
+            st["failures"] = 0
+            if sev > SEV_OK:
+                st["interval"] = float(ui.POLL_INCIDENT_SECONDS)
+            else:
+                # first OK after an incident starts again from the base cadence
+                prev = st["interval"] if st["interval"] >= self._base else self._base / ui.POLL_STABLE_GROWTH
+                st["interval"] = min(float(ui.POLL_STABLE_MAX_SECONDS), prev * ui.POLL_STABLE_GROWTH)
+            self._schedule(st, st["interval"], hint)
+
+    def record_error(self, name: str, hint: float | None = None):
+        with self._lock:
+            st = self._state[name]
+            st["failures"] += 1
+            backoff = min(float(ui.POLL_BACKOFF_MAX_SECONDS), self._base * (2 ** st["failures"]))
+            self._schedule(st, backoff, hint)
+
+    def next_due_in(self, name: str) -> float:
+        with self._lock:
+            return max(0.0, self._state[name]["due"] - time.monotonic())
+
+    def soonest_due_in(self) -> float:
+        with self._lock:
+            soonest = min((st["due"] for st in self._state.values() if not st["in_flight"]), default=None)
+        if soonest is None:
+            return 0.0
+        return max(0.0, soonest - time.monotonic())
+
+    def _schedule(self, st: dict, interval: float, hint: float | None):
+        if hint is not None:
+            interval = max(interval, min(hint, float(ui.POLL_BACKOFF_MAX_SECONDS)))
+        interval *= random.uniform(1.0 - ui.POLL_JITTER, 1.0 + ui.POLL_JITTER)
+        st["due"] = time.monotonic() + interval
+        st["in_flight"] = False
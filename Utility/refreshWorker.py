@@ -0,0 +1,60 @@
+"""
+The overlay's one long-lived refresh thread.
+
+request(names) adds providers to a pending set; requests that arrive while a
+refresh is running are merged and run together next, so at most one refresh
+is ever in flight and a slow upstream can't pile up threads. Results are put
+on `outbox` (a queue the Tk main loop drains) as tuples:
+
+    ("refreshing", names)
+    ("report", report, names)     # StatusPipeline.refresh() report
+    ("error", exception, names)
+
+stop() cancels an in-flight refresh (fetch_providers stops waiting on it) and
+ends the thread.
+"""
+import threading
+
+from Utility.statusSources import RefreshCancelled
+
+
+class RefreshWorker:
+    def __init__(self, pipeline, outbox):
+        self._pipeline = pipeline
+        self.outbox = outbox
+        self._pending = set()
+        self._cond = threading.Condition()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="refresh")
+        self._thread.start()
+
+    def request(self, names=None):
+        """Queues `names` (default: all providers); duplicates of pending names are dropped."""
+        with self._cond:
+            self._pending.update(self._pipeline.names if names is None else names)
+            self._cond.notify()
+
+    def stop(self, timeout: float = 1.0):
+        self._cancel.set()
+        with self._cond:
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._cancel.is_set())
+                if self._cancel.is_set():
+                    return
+                names = [n for n in self._pipeline.names if n in self._pending]
+                self._pending.clear()
+
+            self.outbox.put(("refreshing", names))
+            try:
+                report = self._pipeline.refresh(names, cancel=self._cancel)
+            except RefreshCancelled:
+                return
+            except Exception as e:
+                self.outbox.put(("error", e, names))
+                continue
+            self.outbox.put(("report", report, names))
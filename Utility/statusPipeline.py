@@ -0,0 +1,203 @@
+import json
+import os
+import threading
+import time
+
+import GUI.uiConfig as ui
+from Utility import appPaths, statusSources
+from Utility.circuitBreaker import CircuitBreakers
+from Utility.history import IncidentHistory
+from Utility.pollScheduler import PollScheduler
+
+SNAPSHOT_FILE_NAME = "last_status.json"
+
+
+class StatusPipeline:
+    """
+    Fetch -> classify -> merge, shared by the overlay and the aggregator.
+
+    Keeps the last good segment per provider and a PollScheduler deciding
+    which providers are due. refresh() is safe to call from worker threads.
+
+    A provider whose circuit breaker is open (Utility/circuitBreaker.py) keeps
+    its last good segment on the ticker, marked stale, until it answers again.
+    An answer that comes after its refresh stopped waiting (a breaker trial
+    is short) still counts: the next refresh() takes it as a success.
+
+    The last good segments are also saved to a small snapshot file, so the
+    next launch can show them (marked stale) before anything is fetched;
+    see warm_start().
+    """
+
+    def __init__(self, names=None, snapshot_path: str | None = None, history: IncidentHistory | None = None):
+        self.names = list(statusSources.PROVIDER_NAMES if names is None else names)
+        self.scheduler = PollScheduler(self.names)
+        self.breakers = CircuitBreakers(self.names)
+        self._latest = {}  # provider name -> last good segment
+        self._late = {}    # provider name -> segment that arrived after its refresh gave up on it
+        self._fingerprint = None  # of the last merged list handed out by refresh()
+        self._lock = threading.Lock()
+
+        self._snapshot_path = snapshot_path
+        self._saved = {}     # provider name -> segment as last written to the snapshot
+        self._saved_at = 0.0
+
+        # state transitions go to the incident history (None = off)
+        self.history = history if history is not None else IncidentHistory() if ui.HISTORY_ENABLED else None
+
+    def claim_due(self) -> list[str]:
+        return self.scheduler.claim_due()
+
+    def segments(self) -> list[dict]:
+        with self._lock:
+            return statusSources.ordered_segments(self._latest)
+
+    def refresh(self, names=None, cancel=None) -> dict:
+        """
+        Fetches `names` (default: all) now and merges the results.
+        Returns {"segments": merged list, "changed": bool, "fresh": {name: seg},
+        "failed": {name: error}, "late": {name: seg} (answers that missed an
+        earlier refresh), "open": [names served stale], "elapsed": seconds}.
+        "changed" is False when the merged list is identical to the previous
+        refresh's, so callers can skip redrawing. Raises the first error if no
+        provider succeeded and nothing changed on screen, or RefreshCancelled
+        (nothing recorded) once the `cancel` event is set.
+        """
+        names = list(self.names if names is None else names)
+        start = time.time()
+        # providers behind an open breaker get a short trial instead of the full deadline
+        trials = {n: ui.BREAKER_TRIAL_SECONDS for n in names if self.breakers.is_open(n)}
+        try:
+            results = statusSources.fetch_providers(names, cancel=cancel, deadlines=trials, late=self._record_late)
+        except statusSources.RefreshCancelled:
+            raise
+        except Exception:
+            for name in names:
+                self.scheduler.record_error(name)
+            raise
+
+        fresh, failed, opened = {}, {}, []
+        for name, res in results.items():
+            if res["seg"] is not None:
+                fresh[name] = res["seg"]
+                self.breakers.record_success(name)
+                self.scheduler.record_success(name, res["seg"]["sev"], res["hint"])
+            else:
+                failed[name] = res["error"]
+                hint = res["hint"]
+                if self.breakers.record_failure(name):
+                    opened.append(name)
+                    hint = max(hint or 0.0, self.breakers.cooldown)
+                self.scheduler.record_error(name, hint)
+
+        # successes that missed their deadline (possibly this round's): they close the breaker
+        with self._lock:
+            late, self._late = self._late, {}
+        late = {name: seg for name, seg in late.items() if name not in fresh}
+        for name, seg in late.items():
+            failed.pop(name, None)
+            if name in opened:
+                opened.remove(name)
+            self.breakers.record_success(name)
+            self.scheduler.record_success(name, seg["sev"])
+        fresh_or_late = {**late, **fresh}
+
+        if self.history is not None:
+            for name, seg in fresh_or_late.items():
+                try:
+                    self.history.record(name, seg)
+                except Exception:
+                    pass  # history is best-effort; never fail a refresh over it
+
+        with self._lock:
+            self._latest.update(fresh_or_late)
+            for name in opened:
+                seg = self._latest.get(name)
+                if seg is not None and not seg.get("stale"):
+                    self._latest[name] = mark_stale(seg)  # stale-while-revalidate
+            segs = statusSources.ordered_segments(self._latest)
+            fp = fingerprint(segs)
+            changed = fp != self._fingerprint
+            self._fingerprint = fp
+
+            if not fresh_or_late and not changed:
+                raise next(iter(failed.values()))
+
+            if changed or time.time() - self._saved_at >= ui.SNAPSHOT_SAVE_EVERY_SECONDS:
+                self._saved.update(fresh_or_late)
+                self._save_snapshot()
+
+        return {"segments": segs, "changed": changed, "fresh": fresh, "failed": failed, "late": late,
+                "open": self.breakers.open_names(), "elapsed": time.time() - start}
+
+    def _record_late(self, name: str, seg: dict):
+        # pool thread (see fetch_providers); picked up by the next refresh()
+        with self._lock:
+            self._late[name] = seg
+
+
+    # ---- warm start ----
+    def _snapshot_file(self) -> str:
+        if self._snapshot_path is None:
+            self._snapshot_path = appPaths.data_file(SNAPSHOT_FILE_NAME)
+        return self._snapshot_path
+
+    def _save_snapshot(self):
+        # caller holds _lock; best-effort, atomic replace
+        self._saved_at = time.time()
+        path = self._snapshot_file()
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"saved": self._saved_at, "segments": self._saved}, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def warm_start(self) -> list[dict]:
+        """
+        Seeds the pipeline from the snapshot file and returns those segments,
+        marked stale, in ticker order ([] if there is no usable snapshot).
+        Live results replace them provider by provider as refresh() runs.
+        """
+        try:
+            with open(self._snapshot_file(), "r", encoding="utf-8") as f:
+                saved = json.load(f)["segments"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+
+        oldest = time.time() - ui.SNAPSHOT_MAX_AGE_HOURS * 3600
+        saved = {name: seg for name, seg in saved.items()
+                 if name in self.names and seg.get("fetched", 0) >= oldest}
+
+        with self._lock:
+            self._saved = dict(saved)
+            for name, seg in saved.items():
+                self._latest.setdefault(name, mark_stale(seg))
+            segs = statusSources.ordered_segments(self._latest)
+            self._fingerprint = fingerprint(segs)
+        return segs
+
+
+def mark_stale(seg: dict) -> dict:
+    """Copy of a saved segment flagged stale, with its fetch time appended to the text."""
+    fetched = seg.get("fetched") or 0
+    fmt = "%H:%M" if time.time() - fetched < 20 * 3600 else "%a %H:%M"
+    return dict(seg, stale=True, text=f"{seg['text']} (as of {time.strftime(fmt, time.localtime(fetched))})")
+
+
+def fingerprint(segs) -> int:
+    """Hash of what the ticker draws (text, severity, link, source); timing fields are ignored."""
+    return hash(tuple((s["text"], s["sev"], s.get("url"), bool(s.get("clickable")), s.get("source"))
+                      for s in segs))
+
+
+def describe(report: dict, names) -> str:
+    """Status-line summary of a refresh() report."""
+    fresh, failed = report["fresh"], report["failed"]
+    worst = statusSources.slowest(fresh.values())
+    slow_txt = f" (slowest: {worst['source']} {worst['elapsed']:.1f}s)" if worst else ""
+    fail_txt = f" • {', '.join(failed)} failed, backing off" if failed else ""
+    late_txt = f" • late answer from {', '.join(report['late'])}" if report.get("late") else ""
+    open_txt = f" • last good data for {', '.join(report['open'])}" if report.get("open") else ""
+    return f"Refreshed {len(fresh)}/{len(names)} in {report['elapsed']:.1f}s{slow_txt}{fail_txt}{late_txt}{open_txt}"
@@ -1,19 +1,30 @@
 # Utility/status_sources.py
-import requests
-from bs4 import BeautifulSoup
+import email.utils
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from functools import partial
+
 import xml.etree.ElementTree as ET
-import requests
 
 from GUI import uiConfig
+from Utility import classifier, htmlExtract, metrics
+from Utility.httpCache import DownloadRejected, HttpCache
 
 TIMEOUT = 12
+REFRESH_DEADLINE = 20  # overall budget for one build_segments() call (all providers run in parallel)
+
+# Atom/RSS feeds are newest-first; stop reading once past either limit
+FEED_MAX_ENTRIES = 50
+FEED_MAX_AGE_DAYS = 14
 
 # ----------------------------
 # SOURCES
 # ----------------------------
-CLOUDFLARE_SUMMARY_URL = "https://www.cloudflarestatus.com/api/v2/summary.json"
-CLOUDFLARE_STATUS_PAGE = "https://www.cloudflarestatus.com/"
-
+CLOUDFLARE_STATUSPAGE = "https://www.cloudflarestatus.com"  # Atlassian Statuspage base URL
 
 GOOGLE_ATOM_URL = "https://www.google.com/appsstatus/dashboard/en/feed.atom"
 GOOGLE_STATUS_PAGE = "https://www.google.com/appsstatus/dashboard/"
@@ -21,9 +32,36 @@ GOOGLE_STATUS_PAGE = "https://www.google.com/appsstatus/dashboard/"
 SECURLY_RSS_URL = "https://status.io/pages/5721276eb12b2e5843002acb/rss"
 SECURLY_STATUS_PAGE = "https://securly.status.io/"
 
-
 MICROSOFT_STATUS_PAGE = "https://status.cloud.microsoft/"
 
+# Provider registry, in ticker order. Adding a vendor is data, not code:
+#   kind "statuspage": {"base": "https://status.example.com"}           (Atlassian Statuspage v2 API;
+#                       "probe": False to always download summary.json instead of status.json first)
+#   kind "atom"/"rss": {"url": feed URL, "page": status page URL,
+#                       "resolved_prefix": title prefix marking resolved entries (default "resolved"),
+#                       "resolved_text": word in the summary/description marking resolved (optional)}
+#   kind "html":       {"url": page URL, "banner": all-clear phrase, "incident_words": [...]}
+# Any kind may set "max_bytes" and "content_types" (see MAX_BODY_BYTES / CONTENT_TYPES).
+# Every spec needs "name" (also the ticker label). A providers.json next to main.py
+# (a JSON list of the same dicts) replaces this list; see load_provider_file().
+PROVIDERS = [
+    {"name": "Securly", "kind": "rss", "url": SECURLY_RSS_URL, "page": SECURLY_STATUS_PAGE,
+     "resolved_prefix": None, "resolved_text": "resolved"},
+    {"name": "Cloudflare", "kind": "statuspage", "base": CLOUDFLARE_STATUSPAGE},
+    {"name": "Google Workspace", "kind": "atom", "url": GOOGLE_ATOM_URL, "page": GOOGLE_STATUS_PAGE,
+     "resolved_prefix": "resolved:"},
+    {"name": "Microsoft Cloud", "kind": "html", "url": MICROSOFT_STATUS_PAGE,
+     "banner": "all systems operational", "incident_words": ["outage", "degraded", "incident", "disruption"]},
+]
+PROVIDERS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "providers.json")
+
+# Download limits per response; a spec may override with "max_bytes" / "content_types"
+MAX_BODY_BYTES = 4 * 1024 * 1024  # decoded size; bigger bodies are aborted mid-stream
+# kind -> Content-Type substrings accepted (a captive portal's HTML login page fails "json"/"xml")
+CONTENT_TYPES = {"statuspage": ("json",), "atom": ("xml",), "rss": ("xml",), "html": ("html",)}
+
+MAX_PARALLEL_FETCHES = 8  # thread cap once the registry grows past a handful of vendors
+HTML_FAST_EXTRACT = True  # "html" kind: streaming keyword tokenizer; False = full BeautifulSoup scrape
 
 
 # ----------------------------
@@ -35,7 +73,7 @@ GOOGLE_WATCHLIST = {
 }
 
 US_HINTS = [
-    "united states", "u.s.", " us ", "usa", "north america", "americas",
+    "united states", "u.s.", "US", "usa", "north america", "americas",
     "us-east", "us west", "us-west", "united states of america",
 ]
 GLOBAL_HINTS = [
@@ -46,36 +84,32 @@ NON_US_HINTS = [
     "europe", "emea", "apac", "asia", "australia", "new zealand",
     "japan", "korea", "india", "singapore", "hong kong", "taiwan",
     "china", "middle east", "africa", "south america", "latin america",
-    "canada", "mexico", "uk", "united kingdom", "germany", "france",
+    "canada", "mexico", "UK", "united kingdom", "germany", "france",
     "spain", "italy", "netherlands", "sweden", "norway", "finland",
     "poland", "brazil", "argentina", "chile",
 ]
 
+# Which incidents count as "ours": any "include" hint => relevant,
+# else any "exclude" hint => not relevant, else relevant (unknown => include).
+# Matching is whole-word; hints with capitals are case-sensitive, so "US" won't
+# hit "contact us" and "UK" won't hit "ukraine".
+REGION_PROFILES = {
+    "us": {"include": US_HINTS + GLOBAL_HINTS, "exclude": NON_US_HINTS},
+    "global": {"include": GLOBAL_HINTS, "exclude": []},
+}
+REGION_PROFILE = "us"
+
+# Whole-word matching (see REGION_PROFILES), so inflected forms are listed too
+OUTAGE_WORDS = ["outage", "outages", "major outage", "critical", "down", "downtime",
+                "service outage", "service disruption", "service disruptions"]
+DEGRADED_WORDS = ["degraded", "degradation", "partial", "partially", "minor", "performance",
+                  "incident", "incidents", "maintenance", "under maintenance", "disruption", "disruptions"]
+OK_WORDS = ["operational", "available", "all systems operational"]
+
 
 # ----------------------------
 # HELPERS
 # ----------------------------
-def norm(s: str) -> str:
-    return (s or "").strip().lower()
-
-def has_any(text: str, needles: list[str]) -> bool:
-    t = norm(text)
-    return any(n in t for n in needles)
-
-def relevant_to_us_or_global(title: str, body: str) -> bool:
-    blob = f"{title}\n{body}".strip()
-    t = norm(blob)
-
-    us = has_any(t, US_HINTS)
-    glob = has_any(t, GLOBAL_HINTS)
-    non_us = has_any(t, NON_US_HINTS)
-
-    if us or glob:
-        return True
-    if non_us:
-        return False
-    return True  # unknown => include (safe)
-
 SEV_OK = 0
 SEV_DEGRADED = 1
 SEV_OUTAGE = 2
@@ -83,18 +117,51 @@ SEV_OUTAGE = 2
 def sev_max(a: int, b: int) -> int:
     return a if a >= b else b
 
+_classifier = None
+
+def set_region_profile(name: str):
+    """Switches the active REGION_PROFILES entry (rebuilds the classifier)."""
+    global REGION_PROFILE, _classifier
+    if name not in REGION_PROFILES:
+        raise KeyError(f"unknown region profile {name!r}; have {sorted(REGION_PROFILES)}")
+    REGION_PROFILE = name
+    _classifier = None
+    _entry_memo.clear()  # cached entry verdicts were made under the old profile
+
+def _get_classifier():
+    global _classifier
+    if _classifier is None:
+        profile = REGION_PROFILES[REGION_PROFILE]
+        _classifier = classifier.KeywordClassifier({
+            "outage": OUTAGE_WORDS,
+            "degraded": DEGRADED_WORDS,
+            "ok": OK_WORDS,
+            "include": profile["include"],
+            "exclude": profile["exclude"],
+        })
+    return _classifier
+
+def classify(text: str) -> tuple[int, bool]:
+    """(severity, relevant to the active region profile) in one cached pass."""
+    tags = _get_classifier().classify(text or "")
+
+    if "outage" in tags:
+        sev = SEV_OUTAGE
+    elif "degraded" in tags:
+        sev = SEV_DEGRADED
+    elif "ok" in tags:
+        sev = SEV_OK
+    else:
+        sev = SEV_DEGRADED
+
+    if "include" in tags:
+        relevant = True
+    else:
+        relevant = "exclude" not in tags
+    return sev, relevant
+
 def infer_sev_from_words(text: str) -> int:
-    t = norm(text)
-    outage_words = ["outage", "major outage", "critical", "down", "service outage", "service disruption"]
-    degraded_words = ["degraded", "partial", "minor", "performance", "incident", "maintenance", "under maintenance", "disruption"]
-
-    if any(w in t for w in outage_words):
-        return SEV_OUTAGE
-    if any(w in t for w in degraded_words):
-        return SEV_DEGRADED
-    if "operational" in t or "available" in t or "all systems operational" in t:
-        return SEV_OK
-    return SEV_DEGRADED
+    return classify(text)[0]
 
 def color_for_sev(sev: int) -> str:
     if sev == SEV_OUTAGE:
@@ -103,224 +170,575 @@ def color_for_sev(sev: int) -> str:
         return uiConfig.COLOR_DEGRADED
     return uiConfig.COLOR_OK
 
+# ----------------------------
+# FEED STREAMING
+# ----------------------------
+ATOM_NS = "http://www.w3.org/2005/Atom"
+
+
+def iter_feed_items(raw, item_tag: str, date_of, max_entries: int = FEED_MAX_ENTRIES,
+                    max_age_days: float = FEED_MAX_AGE_DAYS):
+    """
+    Incrementally parses an XML stream and yields each completed `item_tag`
+    element. The element is freed (cleared and detached) once the caller moves
+    on, so memory stays flat however long the feed's history is.
+
+    Stops after `max_entries` items, or at the first item whose date_of(elem)
+    is older than `max_age_days`. Items without a date are never cut off.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    seen = 0
+    parents = []
+
+    for event, elem in ET.iterparse(raw, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+
+        parents.pop()
+        if elem.tag != item_tag:
+            continue
+
+        when = date_of(elem)
+        if seen >= max_entries or (when is not None and when < cutoff):
+            return
+
+        seen += 1
+        yield elem
+
+        elem.clear()
+        if parents:
+            parents[-1].remove(elem)
+
+
+def _parse_iso_date(s: str):
+    s = (s or "").strip()
+    if not s:
+        return None
+    try:
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _parse_rfc822_date(s: str):
+    s = (s or "").strip()
+    if not s:
+        return None
+    try:
+        dt = email.utils.parsedate_to_datetime(s)
+    except (TypeError, ValueError):
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _atom_entry_date(e):
+    return _parse_iso_date(e.findtext(f"{{{ATOM_NS}}}updated") or e.findtext(f"{{{ATOM_NS}}}published"))
+
+
+def _rss_item_date(item):
+    return _parse_rfc822_date(item.findtext("pubDate"))
+
+
 # ----------------------------
 # FETCHERS
 # ----------------------------
-def fetch_cloudflare():
-    r = requests.get(CLOUDFLARE_SUMMARY_URL, timeout=TIMEOUT)
-    r.raise_for_status()
-    data = r.json()
+# Every provider goes through the same pipeline:
+#   HTTP (http_cache: conditional GET, 304 -> previous result) -> adapter parse -> classify -> segment
+# ETag/Last-Modified aware; a 304 returns the previous parse result as-is
+http_cache = HttpCache()
 
-    indicator = (data.get("status", {}).get("indicator") or "unknown").lower()
-    if indicator == "none":
-        return {"text": "Cloudflare: Operational", "sev": SEV_OK, "url": None, "clickable": False}
 
-    incidents = data.get("incidents", []) or []
-    relevant_titles = []
-    worst = SEV_OK
-    best_url = CLOUDFLARE_STATUS_PAGE
+# Bump when a parser/classifier change should invalidate cached parse results
+PARSE_FORMAT_VERSION = 1
 
-    for inc in incidents:
-        title = inc.get("name", "") or ""
-        updates = inc.get("incident_updates", []) or []
-        body = updates[0].get("body", "") if updates else ""
 
-        if not relevant_to_us_or_global(title, body):
-            continue
+def parser_key(spec: dict) -> str:
+    """
+    Everything a cached parse result depends on besides the body: the spec,
+    the region profile and keyword lists, and PARSE_FORMAT_VERSION.
+    """
+    blob = json.dumps([PARSE_FORMAT_VERSION, spec, REGION_PROFILE, REGION_PROFILES[REGION_PROFILE],
+                       OUTAGE_WORDS, DEGRADED_WORDS, OK_WORDS, HTML_FAST_EXTRACT],
+                      sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
 
-        impact = (inc.get("impact") or "").lower()
-        sev = SEV_DEGRADED if impact == "minor" else SEV_OUTAGE if impact in ("major", "critical") else infer_sev_from_words(title + " " + body)
-        worst = sev_max(worst, sev)
 
-        if title.strip():
-            relevant_titles.append(title.strip())
+def download(spec: dict, url: str, parse):
+    """GET through http_cache with the spec's byte cap and Content-Type check."""
+    return http_cache.get(url, parse, TIMEOUT,
+                          max_bytes=spec.get("max_bytes", MAX_BODY_BYTES),
+                          content_types=spec.get("content_types", CONTENT_TYPES[spec["kind"]]),
+                          parser_key=parser_key(spec))
 
-        if inc.get("shortlink"):
-            best_url = inc["shortlink"]
 
-    if not relevant_titles:
-        return {"text": "Cloudflare: Operational", 
-                "sev": SEV_OK, 
-                "url": None, 
-                "clickable": True
-            }
+def make_segment(label: str, worst: int, details: list[str], url: str | None, ok_url: str | None):
+    """The ticker entry for one provider: "<label>: Operational" or "<label>: <Header> — a; b"."""
+    if not details:
+        return {"text": f"{label}: Operational", "sev": SEV_OK, "url": ok_url, "clickable": bool(ok_url)}
 
     header = "Outage" if worst == SEV_OUTAGE else "Degraded"
-    details = "; ".join(relevant_titles[:2])
-    return {"text": f"Cloudflare: {header} — {details}", 
-            "sev": worst, 
-            "url": best_url, 
-            "clickable": True
-        }
+    return {"text": f"{label}: {header} — {'; '.join(details[:2])}", "sev": worst,
+            "url": url or ok_url, "clickable": True}
 
 
-def fetch_google_workspace():
-    r = requests.get(GOOGLE_ATOM_URL, timeout=TIMEOUT)
-    r.raise_for_status()
+# ---- incremental entry processing ----
+# Feed entries and Statuspage incidents carry an id and an update stamp; their
+# verdict (resolved? severity, relevance, title, link) is kept per provider and
+# reused while both match, so a poll only classifies new or edited entries.
+# Each parse keeps just the entries it saw, so a memo never outgrows its feed.
+_entry_memo = {}  # provider name -> {entry id: (stamp, verdict)}
 
-    ns = {"a": "http://www.w3.org/2005/Atom"}
-    root = ET.fromstring(r.text)
 
-    entries = root.findall("a:entry", ns)
+class _EntryPass:
+    """One parse's view of a provider's memo; commit() swaps in the entries seen."""
 
-    impacted = []
-    worst = SEV_OK
-    best_url = GOOGLE_STATUS_PAGE
+    def __init__(self, provider: str):
+        self.provider = provider
+        self._old = _entry_memo.get(provider, {})
+        self._seen = {}
+        self.reused = 0
+        self.computed = 0
 
-    for e in entries:
-        title = (e.findtext("a:title", default="", namespaces=ns) or "").strip()
-        title_l = title.lower()
+    def verdict(self, key, stamp, compute):
+        if key:
+            hit = self._old.get(key)
+            if hit is not None and hit[0] == stamp:
+                self._seen[key] = hit
+                self.reused += 1
+                return hit[1]
 
-        # Skip resolved incidents
-        if title_l.startswith("resolved:"):
-            continue
+        v = compute()
+        self.computed += 1
+        if key:
+            self._seen[key] = (stamp, v)
+        return v
 
-        summary = (e.findtext("a:summary", default="", namespaces=ns) or "").strip()
+    def commit(self):
+        _entry_memo[self.provider] = self._seen
+        if self.reused:
+            metrics.inc("ticker_entries_total", self.reused, provider=self.provider, result="reused")
+        if self.computed:
+            metrics.inc("ticker_entries_total", self.computed, provider=self.provider, result="classified")
 
-        # Infer severity from text (title + summary)
-        sev = infer_sev_from_words(title + " " + summary)
 
-        # Only keep degraded/outage
-        if sev == SEV_OK:
-            continue
+# ---- Atlassian Statuspage v2 (Cloudflare and most SaaS vendors) ----
+# Two-phase: poll the tiny status.json indicator (a few hundred bytes) and only
+# download the unresolved incidents when it isn't "none". Both requests go
+# through http_cache, so an unchanged incident list is a 304.
+def _statuspage_api(spec: dict, path: str) -> str:
+    return spec["base"].rstrip("/") + "/api/v2/" + path
 
-        # No nested loop: directly find the alternate link
-        link_el = e.find("a:link[@rel='alternate']", ns)
-        link_url = (link_el.get("href") or "").strip() if link_el is not None else ""
 
-        # Prefer first incident URL we find
-        if link_url and best_url == GOOGLE_STATUS_PAGE:
-            best_url = link_url
+def _statuspage_page(spec: dict) -> str:
+    return spec.get("page") or spec["base"].rstrip("/") + "/"
 
-        worst = sev_max(worst, sev)
-        impacted.append(" ".join(title.split()))  # normalize whitespace/newlines
 
-    # If nothing active + degraded/outage, report overall operational
-    if not impacted:
-        return {
-            "text": "Google Workspace: Operational",
-            "sev": SEV_OK,
-            "url": GOOGLE_STATUS_PAGE,
-            "clickable": True
-        }
+def _statuspage_urls(spec: dict) -> list[str]:
+    if not spec.get("probe", True):
+        return [_statuspage_api(spec, "summary.json")]
+    return [_statuspage_api(spec, "status.json"), _statuspage_api(spec, "incidents/unresolved.json")]
 
-    header = "Outage" if worst == SEV_OUTAGE else "Degraded"
-    details = "; ".join(impacted[:2])
 
-    return {
-        "text": f"Google Workspace: {header} — {details}",
-        "sev": worst,
-        "url": best_url or GOOGLE_STATUS_PAGE,
-        "clickable": True
-    }
+def _parse_statuspage_indicator(r):
+    return ((r.json().get("status") or {}).get("indicator") or "unknown").lower()
+
 
+def _fetch_statuspage(spec: dict):
+    urls = _statuspage_urls(spec)
+    if len(urls) == 2:
+        indicator = download(spec, urls[0], _parse_statuspage_indicator)
+        if indicator == "none":
+            return make_segment(spec["name"], SEV_OK, [], None, _statuspage_page(spec))
+    return download(spec, urls[-1], lambda r: _parse_statuspage(r, spec))
 
 
+def _parse_statuspage(r, spec: dict):
+    # summary.json or incidents/unresolved.json; only the former carries "status"
+    data = r.json()
+    page = _statuspage_page(spec)
 
+    indicator = ((data.get("status") or {}).get("indicator") or "").lower()
+    if indicator == "none":
+        return make_segment(spec["name"], SEV_OK, [], None, page)
 
-def fetch_securly():
-    r = requests.get(SECURLY_RSS_URL, timeout=TIMEOUT)
-    r.raise_for_status()
+    relevant_titles = []
+    worst = SEV_OK
+    best_url = page
+    memo = _EntryPass(spec["name"])
+
+    for inc in data.get("incidents", []) or []:
+        # updated_at moves on every incident update; without it, key on the content
+        stamp = inc.get("updated_at") or (inc.get("name"), inc.get("impact"), len(inc.get("incident_updates") or ()))
+        sev = memo.verdict(inc.get("id"), stamp, lambda: _statuspage_incident_sev(inc))
+        if sev is None:
+            continue
 
-    root = ET.fromstring(r.text)
+        worst = sev_max(worst, sev)
 
-    # RSS namespace handling (status.io uses plain RSS2)
-    items = root.findall(".//item")
+        title = (inc.get("name", "") or "").strip()
+        if title:
+            relevant_titles.append(title)
 
-    active = []
-    worst = SEV_OK
-    best_url = SECURLY_STATUS_PAGE
+        if inc.get("shortlink"):
+            best_url = inc["shortlink"]
 
-    for item in items:
-        title = (item.findtext("title") or "").strip()
-        desc = (item.findtext("description") or "").lower()
-        link = (item.findtext("link") or "").strip()
+    memo.commit()
+    return make_segment(spec["name"], worst, relevant_titles, best_url, page)
+
+
+def _statuspage_incident_sev(inc: dict):
+    # None = not relevant to this region profile
+    title = inc.get("name", "") or ""
+    updates = inc.get("incident_updates", []) or []
+    body = updates[0].get("body", "") if updates else ""
+
+    text_sev, relevant = classify(f"{title}\n{body}")
+    if not relevant:
+        return None
+
+    impact = (inc.get("impact") or "").lower()
+    return SEV_DEGRADED if impact == "minor" else SEV_OUTAGE if impact in ("major", "critical") else text_sev
+
+
+# ---- RSS 2.0 / Atom feeds ----
+# per flavor: entry tag, id, stamp, title, summary, date parser, link getter.
+# "stamp_is_update": the stamp changes whenever the entry is edited (Atom
+# <updated>); RSS <pubDate> is only the publish time, so it isn't.
+_FEED_FLAVORS = {
+    "atom": {
+        "item": f"{{{ATOM_NS}}}entry",
+        "id": f"{{{ATOM_NS}}}id",
+        "stamp": f"{{{ATOM_NS}}}updated",
+        "stamp_is_update": True,
+        "title": f"{{{ATOM_NS}}}title",
+        "summary": f"{{{ATOM_NS}}}summary",
+        "date": _atom_entry_date,
+        "link": lambda e: next((l.get("href") or "" for l in e.findall(f"{{{ATOM_NS}}}link")
+                                if l.get("rel", "alternate") == "alternate"), ""),
+    },
+    "rss": {
+        "item": "item",
+        "id": "guid",
+        "stamp": "pubDate",
+        "stamp_is_update": False,
+        "title": "title",
+        "summary": "description",
+        "date": _rss_item_date,
+        "link": lambda e: e.findtext("link") or "",
+    },
+}
+
+
+def _parse_feed(r, spec: dict):
+    flavor = _FEED_FLAVORS[spec["kind"]]
+    resolved_prefix = (spec.get("resolved_prefix", "resolved") or "").lower()
+    resolved_text = (spec.get("resolved_text") or "").lower()
 
-        # Skip resolved incidents
-        if "resolved" in desc:
+    impacted = []
+    worst = SEV_OK
+    best_url = None
+    memo = _EntryPass(spec["name"])
+
+    for e in iter_feed_items(r.raw, flavor["item"], flavor["date"]):
+        key = (e.findtext(flavor["id"]) or "").strip()
+        stamp = (e.findtext(flavor["stamp"]) or "").strip()
+        if not (stamp and flavor["stamp_is_update"]):
+            # no real update time: an edit (e.g. "Resolved" added) only shows in the content
+            stamp = (stamp, hash((e.findtext(flavor["title"]), e.findtext(flavor["summary"]))))
+        verdict = memo.verdict(key, stamp, lambda: _feed_entry_verdict(e, flavor, resolved_prefix, resolved_text))
+        if verdict is None:
             continue
+        sev, title, link_url = verdict
 
-        sev = infer_sev_from_words(title + " " + desc)
-        worst = sev_max(worst, sev)
+        # Newest incident link wins (feeds are newest-first)
+        if link_url and best_url is None:
+            best_url = link_url
 
+        worst = sev_max(worst, sev)
         if title:
-            active.append(title)
+            impacted.append(title)
 
-        if link:
-            best_url = link
+    memo.commit()
+    return make_segment(spec["name"], worst, impacted, best_url, spec.get("page") or spec["url"])
 
-    # No active incidents
-    if not active:
-        return {
-            "text": "Securly: Operational",
-            "sev": SEV_OK,
-            "url": best_url,
-            "clickable": True
-        }
 
-    header = "Outage" if worst == SEV_OUTAGE else "Degraded"
-    details = "; ".join(active[:2])
+def _feed_entry_verdict(e, flavor: dict, resolved_prefix: str, resolved_text: str):
+    # (sev, title, link) for an active degraded/outage entry, else None
+    title = (e.findtext(flavor["title"]) or "").strip()
+    summary = (e.findtext(flavor["summary"]) or "").strip()
+
+    # Skip resolved incidents
+    if resolved_prefix and title.lower().startswith(resolved_prefix):
+        return None
+    if resolved_text and resolved_text in summary.lower():
+        return None
+
+    # Only keep degraded/outage
+    sev = infer_sev_from_words(title + " " + summary)
+    if sev == SEV_OK:
+        return None
+
+    return sev, " ".join(title.split()), flavor["link"](e).strip()  # normalize whitespace/newlines
 
-    return {
-        "text": f"Securly: {header} — {details}",
-        "sev": worst,
-        "url": best_url,
-        "clickable": True
-    }
 
+# ---- HTML status pages (keyword scrape) ----
+def _html_keywords(spec: dict) -> tuple:
+    return tuple(spec["incident_words"]) + (spec["banner"],)
 
-def fetch_microsoft():
-    r = requests.get(MICROSOFT_STATUS_PAGE, timeout=TIMEOUT)
-    r.raise_for_status()
 
-    soup = BeautifulSoup(r.text, "html.parser")
-    lines = [ln.strip() for ln in soup.get_text("\n").splitlines() if ln.strip()]
+def _fetch_html(spec: dict):
+    if not HTML_FAST_EXTRACT:
+        return download(spec, spec["url"], lambda r: _parse_html_soup(r, spec))
+    try:
+        return download(spec, spec["url"], lambda r: _parse_html(r, spec))
+    except htmlExtract.ExtractError:
+        # The streamed bytes are gone by now (they aren't kept, so the fast path
+        # never holds the whole page); fetch the page again for the full scrape.
+        metrics.inc("ticker_html_fallbacks_total", provider=spec["name"])
+        return download(spec, spec["url"], lambda r: _parse_html_soup(r, spec))
 
+
+def _parse_html(r, spec: dict):
+    # Stream the page through the keyword tokenizer. Download errors (timeouts,
+    # resets, DownloadRejected) propagate as they are: scraping what arrived
+    # before them could report a truncated page as operational.
+    lines = htmlExtract.extract_lines(r.iter_content(chunk_size=16384), _html_keywords(spec),
+                                      r.encoding or "utf-8")
+    return _html_segment(lines, spec)
+
+
+def _parse_html_soup(r, spec: dict):
+    return _html_segment(_html_lines_soup(r.text), spec)
+
+
+def _html_lines_soup(html: str):
+    # Original full-page scrape; kept as the fallback/reference path
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    return [ln.strip() for ln in soup.get_text("\n").splitlines() if ln.strip()]
+
+
+def _html_segment(lines, spec: dict):
     incidents = []
     worst = SEV_OK
-    best_url = MICROSOFT_STATUS_PAGE
-    saw_all_operational = False
+    incident_words = tuple(spec["incident_words"])
 
     for ln in lines:
         l = ln.lower()
 
-        # 1) Detect the "everything is fine" banner
-        if "all systems operational" in l:
-            saw_all_operational = True
-            # don't return yet; keep scanning in case the page contains both phrases
-
-        # 2) Collect possible incident lines
-        if any(word in l for word in ("outage", "degraded", "incident", "disruption")):
-            if not relevant_to_us_or_global(ln, ln):
+        # The all-clear banner alone doesn't matter: operational is the default.
+        # Collect possible incident lines
+        if any(word in l for word in incident_words):
+            sev, relevant = classify(ln)
+            if not relevant:
                 continue
 
-            sev = infer_sev_from_words(ln)
             worst = sev_max(worst, sev)
             incidents.append(ln)
 
-    # If we found any relevant incidents, show them
-    if incidents:
-        header = "Outage" if worst == SEV_OUTAGE else "Degraded"
-        details = "; ".join(incidents[:2])
-        return {
-            "text": f"Microsoft Cloud: {header} — {details}",
-            "sev": worst,
-            "url": best_url,
-            "clickable": True
-        }
+    return make_segment(spec["name"], worst, incidents, spec["url"], spec["url"])
 
-    # Otherwise, treat as operational
-    # Prefer the explicit banner if present, but either way operational is fine
-    if saw_all_operational or not incidents:
-        return {
-            "text": "Microsoft Cloud: Operational",
-            "sev": SEV_OK,
-            "url": best_url,
-            "clickable": True
-        }
 
+# ---- registry plumbing ----
+def _single_url(spec: dict) -> list[str]:
+    return [spec["url"]]
 
 
+def _single_fetch(parse):
+    return lambda spec: download(spec, spec["url"], lambda r: parse(r, spec))
+
+
+# kind -> (URLs a fetch may request, first one carrying the polling hints; fetch(spec) -> segment)
+ADAPTERS = {
+    "statuspage": (_statuspage_urls, _fetch_statuspage),
+    "atom": (_single_url, _single_fetch(_parse_feed)),
+    "rss": (_single_url, _single_fetch(_parse_feed)),
+    "html": (_single_url, _fetch_html),
+}
 
-def build_segments():
-    return [fetch_securly(), fetch_cloudflare(), fetch_google_workspace(), fetch_microsoft()]
+
+def provider_urls(spec: dict) -> list[str]:
+    return ADAPTERS[spec["kind"]][0](spec)
+
+
+def fetch_provider(spec: dict):
+    return ADAPTERS[spec["kind"]][1](spec)
+
+
+def validate_spec(spec: dict):
+    if not spec.get("name"):
+        raise ValueError(f"provider spec without a name: {spec!r}")
+    kind = spec.get("kind")
+    if kind not in ADAPTERS:
+        raise ValueError(f"{spec['name']}: unknown kind {kind!r}; have {sorted(ADAPTERS)}")
+    required = {"statuspage": ("base",), "atom": ("url",), "rss": ("url",),
+                "html": ("url", "banner", "incident_words")}[kind]
+    missing = [k for k in required if not spec.get(k)]
+    if missing:
+        raise ValueError(f"{spec['name']}: missing {', '.join(missing)}")
+
+
+def load_provider_file(path: str = PROVIDERS_FILE):
+    """Returns the spec list from a providers.json, or None if there is no such file."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        specs = json.load(f)
+    for spec in specs:
+        validate_spec(spec)
+    return specs
+
+
+# ----------------------------
+# REFRESH
+# ----------------------------
+FETCHERS = []        # (name, fetch(), request urls; the first one's response headers carry polling hints)
+PROVIDER_NAMES = []  # ticker order
+
+
+def set_providers(specs):
+    """Installs a provider list (validated) as the registry used by fetch_providers()."""
+    global PROVIDERS, FETCHERS, PROVIDER_NAMES
+    for spec in specs:
+        validate_spec(spec)
+    PROVIDERS = list(specs)
+    FETCHERS = [(spec["name"], partial(fetch_provider, spec), provider_urls(spec)) for spec in PROVIDERS]
+    PROVIDER_NAMES = [spec["name"] for spec in PROVIDERS]
+
+
+set_providers(load_provider_file() or PROVIDERS)
+
+
+CANCEL_CHECK_SECONDS = 0.2  # how often a waiting fetch_providers() looks at its cancel event
+
+
+class RefreshCancelled(Exception):
+    """fetch_providers() was told to stop waiting (shutdown)."""
+
+
+_fetch_pool = None  # shared across refreshes so the thread count stays at MAX_PARALLEL_FETCHES
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _fetch_pool
+    if _fetch_pool is None:
+        _fetch_pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_FETCHES, thread_name_prefix="fetch")
+    return _fetch_pool
+
+
+def _timed_fetch(name: str, fetch):
+    start = time.monotonic()
+    seg = fetch()
+    seg["source"] = name
+    seg["elapsed"] = time.monotonic() - start
+    seg["fetched"] = time.time()
+    return seg
+
+
+def fetch_providers(names=None, deadline: float = REFRESH_DEADLINE, cancel=None, deadlines=None, late=None):
+    """
+    Runs the named fetchers (default: all) in parallel.
+    Returns {name: {"seg": dict | None, "error": Exception | None, "hint": float | None}}
+    for every requested provider. Providers still running at the deadline get a
+    TimeoutError; `deadlines` ({name: seconds}) gives some providers a shorter one.
+    If one of those still succeeds afterwards, late(name, seg) is called from the
+    pool thread that ran it. "hint" is the server's Retry-After / max-age in seconds, if any.
+    Raises RefreshCancelled if the `cancel` event (threading.Event) gets set first.
+    """
+    wanted = [(n, fn, urls) for n, fn, urls in FETCHERS if names is None or n in names]
+    if not wanted:
+        return {}
+
+    for _, _, urls in wanted:
+        http_cache.forget_stats(urls)  # so a skipped second phase doesn't report last round's bytes
+
+    limits = {n: min(deadline, (deadlines or {}).get(n, deadline)) for n, _, _ in wanted}
+    futures = {n: _pool().submit(_timed_fetch, n, fn) for n, fn, _ in wanted}
+    start = time.monotonic()
+    ends = {futures[n]: start + limits[n] for n, _, _ in wanted}
+    pending = set(futures.values())
+    try:
+        while pending:
+            now = time.monotonic()
+            waiting = {f for f in pending if ends[f] > now}
+            if not waiting:
+                break
+            if cancel is not None and cancel.is_set():
+                raise RefreshCancelled()
+            timeout = min(min(ends[f] for f in waiting) - now, CANCEL_CHECK_SECONDS)
+            _, still = wait(waiting, timeout=max(0.0, timeout))
+            pending = (pending - waiting) | still
+    finally:
+        # don't block on stragglers (their own TIMEOUT ends them); drop any not started yet
+        for fut in pending:
+            fut.cancel()
+    done = set(futures.values()) - pending
+
+    results = {}
+    for name, _, urls in wanted:
+        fut = futures[name]
+        res = {"seg": None, "error": None, "hint": http_cache.poll_hint(urls[0])}
+        if fut not in done:
+            res["error"] = TimeoutError(f"{name}: no answer within {limits[name]:.0f}s")
+            if late is not None and not fut.cancelled():
+                fut.add_done_callback(partial(_deliver_late, late, name))
+        elif fut.exception() is not None:
+            res["error"] = fut.exception()
+        else:
+            res["seg"] = fut.result()
+        results[name] = res
+        _record_fetch_metrics(name, urls, res)
+    return results
+
+
+def _deliver_late(late, name: str, fut):
+    if fut.exception() is None:
+        late(name, fut.result())
+
+
+def _record_fetch_metrics(name: str, urls, res: dict):
+    if res["seg"] is None:
+        metrics.inc("ticker_fetch_errors_total", provider=name)
+        return
+
+    metrics.observe("ticker_fetch_seconds", res["seg"]["elapsed"], provider=name)
+    metrics.set_gauge("ticker_last_success_timestamp_seconds", time.time(), provider=name)
+
+    for url in urls:
+        stats = http_cache.last_stats(url)
+        if stats.get("not_modified"):
+            metrics.inc("ticker_not_modified_total", provider=name)
+        elif stats:
+            metrics.inc("ticker_bytes_received_total", stats["bytes"], provider=name)
+            metrics.inc("ticker_bytes_decoded_total", stats["decoded_bytes"], provider=name)
+            metrics.observe("ticker_parse_seconds", stats["parse_seconds"], provider=name)
+
+
+def build_segments(deadline: float = REFRESH_DEADLINE):
+    """
+    Fetches every provider in parallel and returns the segments that finished
+    within `deadline` seconds, in FETCHERS order; a provider that fails or times
+    out is left out. Each segment carries "source", "elapsed" (seconds) so
+    callers can see the slowest provider, and "fetched" (unix time). Raises the
+    first error only if no provider answered.
+    """
+    results = fetch_providers(deadline=deadline)
+    segs = [res["seg"] for res in results.values() if res["seg"] is not None]
+    if not segs:
+        raise next((res["error"] for res in results.values()),
+                   TimeoutError(f"no provider answered within {deadline:.0f}s"))
+    return segs
+
+
+def ordered_segments(latest: dict):
+    """{provider name: segment} -> list in ticker order (missing providers skipped)."""
+    return [latest[n] for n in PROVIDER_NAMES if n in latest]
+
+
+def slowest(segs):
+    """Returns the segment with the largest "elapsed", or None."""
+    timed = [s for s in segs if "elapsed" in s]
+    return max(timed, key=lambda s: s["elapsed"], default=None)
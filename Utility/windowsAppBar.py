@@ -4,6 +4,7 @@ from Utility import statusSources
 
 user32 = ctypes.windll.user32
 shell32 = ctypes.windll.shell32
+gdi32 = ctypes.windll.gdi32
 
 ABM_NEW = 0x00000000
 ABM_REMOVE = 0x00000001
@@ -12,6 +13,9 @@ ABM_SETPOS = 0x00000003
 
 ABE_TOP = 1
 
+VREFRESH = 116                 # GetDeviceCaps index
+DESKTOP_SWITCHDESKTOP = 0x0100
+
 
 class APPBARDATA(ctypes.Structure):
     _fields_ = [
@@ -106,3 +110,43 @@ def appbar_remove(hwnd: int):
     abd.cbSize = ctypes.sizeof(APPBARDATA)
     abd.hWnd = wintypes.HWND(hwnd)
     shell32.SHAppBarMessage(ABM_REMOVE, ctypes.byref(abd))
+
+
+def display_refresh_hz() -> int | None:
+    """Refresh rate of the primary display, or None when Windows only reports "hardware default"."""
+    hdc = user32.GetDC(0)
+    try:
+        hz = gdi32.GetDeviceCaps(hdc, VREFRESH)
+    finally:
+        user32.ReleaseDC(0, hdc)
+    return hz if hz > 1 else None
+
+
+def session_locked() -> bool:
+    """
+    True while the workstation is locked (or the secure desktop, e.g. a UAC
+    prompt, has the input): the input desktop can't be opened/switched to then.
+    """
+    hdesk = user32.OpenInputDesktop(0, False, DESKTOP_SWITCHDESKTOP)
+    if not hdesk:
+        return True
+    try:
+        return not user32.SwitchDesktop(hdesk)
+    finally:
+        user32.CloseDesktop(hdesk)
+
+
+def fullscreen_window_on(monitor_rect: dict) -> bool:
+    """True if the foreground window covers the whole monitor (a fullscreen game, video or slideshow)."""
+    hwnd = user32.GetForegroundWindow()
+    if not hwnd or hwnd == user32.GetShellWindow():
+        return False
+    cls = ctypes.create_unicode_buffer(64)
+    user32.GetClassNameW(hwnd, cls, 64)
+    if cls.value in ("Progman", "WorkerW"):  # the desktop itself
+        return False
+    rc = wintypes.RECT()
+    if not user32.GetWindowRect(hwnd, ctypes.byref(rc)):
+        return False
+    return (rc.left <= monitor_rect["left"] and rc.top <= monitor_rect["top"]
+            and rc.right >= monitor_rect["right"] and rc.bottom >= monitor_rect["bottom"])
@@ -1,5 +1,27 @@
-from GUI.tickerOverlay import TickerOverlay
+import argparse
+
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Status ticker overlay")
+    ap.add_argument("--serve", action="store_true",
+                    help="run headless as a shared aggregator instead of showing the bar")
+    ap.add_argument("--host", default="0.0.0.0", help="aggregator bind address (with --serve)")
+    ap.add_argument("--port", type=int, default=None, help="aggregator port (with --serve)")
+    ap.add_argument("--history", type=float, nargs="?", const=7.0, metavar="DAYS",
+                    help="print time degraded/down per provider over the last DAYS (default 7) and exit")
+    return ap.parse_args()
+
 
 if __name__ == "__main__":
-    app = TickerOverlay()
-    app.mainloop()
\ No newline at end of file
+    args = parse_args()
+
+    if args.history is not None:
+        from Utility import history
+        print(history.report(args.history))
+    elif args.serve:
+        from Utility import aggregator
+        aggregator.serve(args.host, args.port or aggregator.DEFAULT_PORT)
+    else:
+        from GUI.tickerOverlay import TickerOverlay
+        app = TickerOverlay()
+        app.mainloop()
@@ -0,0 +1,35 @@
+import unittest
+
+from Utility.circuitBreaker import CircuitBreakers
+
+
+class CircuitBreakersTest(unittest.TestCase):
+    def test_opens_after_threshold(self):
+        b = CircuitBreakers(["A", "B"], failures=3, cooldown=900)
+        self.assertFalse(b.record_failure("A"))
+        self.assertFalse(b.record_failure("A"))
+        self.assertTrue(b.record_failure("A"))
+        self.assertTrue(b.is_open("A"))
+        self.assertFalse(b.is_open("B"))
+        self.assertEqual(b.open_names(), ["A"])
+
+    def test_success_closes_and_resets_count(self):
+        b = CircuitBreakers(["A"], failures=2, cooldown=900)
+        b.record_failure("A")
+        b.record_failure("A")
+        b.record_success("A")
+        self.assertFalse(b.is_open("A"))
+        self.assertEqual(b.open_names(), [])
+        self.assertFalse(b.record_failure("A"))  # counting starts over
+
+    def test_success_in_between_keeps_it_closed(self):
+        b = CircuitBreakers(["A"], failures=3, cooldown=900)
+        for _ in range(5):
+            b.record_failure("A")
+            b.record_failure("A")
+            b.record_success("A")
+        self.assertFalse(b.is_open("A"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from Utility import statusSources
+from Utility.statusSources import SEV_DEGRADED, SEV_OK, SEV_OUTAGE, classify
+
+
+class ClassifyTest(unittest.TestCase):
+    def setUp(self):
+        statusSources.set_region_profile("us")
+
+    def test_severity(self):
+        cases = [
+            ("Multiple outages affecting Teams", SEV_OUTAGE),
+            ("Service downtime for Exchange", SEV_OUTAGE),
+            ("Major outage: SharePoint", SEV_OUTAGE),
+            ("Gmail is down", SEV_OUTAGE),
+            ("Intermittent service disruptions in Drive", SEV_OUTAGE),
+            ("Degraded performance for Outlook", SEV_DEGRADED),
+            ("Some users see disruptions", SEV_DEGRADED),
+            ("Two incidents under investigation", SEV_DEGRADED),
+            ("Search is partially unavailable", SEV_DEGRADED),
+            ("All systems operational", SEV_OK),
+            ("Slow file download from the portal", SEV_DEGRADED),  # "download" is not "down"
+        ]
+        for text, sev in cases:
+            with self.subTest(text=text):
+                self.assertEqual(classify(text)[0], sev)
+
+    def test_region(self):
+        cases = [
+            ("Outage affecting users in the US", True),
+            ("Outage affecting users in the UK", False),
+            ("Outage in Ukraine datacenter", True),        # "UK" is whole-word, case-sensitive
+            ("Degraded service, contact us for help", True),  # "us" is not "US": unknown region
+            ("Outage in Europe; contact us", False),
+            ("Outage in Europe and North America", True),  # include wins
+            ("Global outage", True),
+        ]
+        for text, relevant in cases:
+            with self.subTest(text=text):
+                self.assertEqual(classify(text)[1], relevant)
+
+    def test_unicode_case_variants(self):
+        # IGNORECASE matches "ſ" (long s) for "s" and "K" (Kelvin sign) for "k"
+        self.assertEqual(classify("uſa outage"), (SEV_OUTAGE, True))
+        self.assertEqual(classify("\u212aorea degraded"), (SEV_DEGRADED, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
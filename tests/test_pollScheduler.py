@@ -0,0 +1,60 @@
+import unittest
+from unittest import mock
+
+import GUI.uiConfig as ui
+from Utility.pollScheduler import PollScheduler
+from Utility.statusSources import SEV_DEGRADED, SEV_OK
+
+
+class PollSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(ui, "POLL_JITTER", 0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.s = PollScheduler(["A", "B"], base_seconds=60)
+
+    def test_claim_marks_in_flight(self):
+        self.assertEqual(sorted(self.s.claim_due()), ["A", "B"])
+        self.assertEqual(self.s.claim_due(), [])
+        self.s.record_success("A", SEV_OK)
+        self.assertEqual(self.s.claim_due(), [])  # rescheduled, not due yet
+
+    def test_ok_slows_down_up_to_max(self):
+        for _ in range(20):
+            self.s.record_success("A", SEV_OK)
+        self.assertAlmostEqual(self.s.next_due_in("A"), ui.POLL_STABLE_MAX_SECONDS, delta=1)
+
+    def test_incident_polls_fast(self):
+        self.s.record_success("A", SEV_DEGRADED)
+        self.assertAlmostEqual(self.s.next_due_in("A"), ui.POLL_INCIDENT_SECONDS, delta=1)
+
+    def test_error_backoff_doubles_and_caps(self):
+        self.s.record_error("A")
+        self.assertAlmostEqual(self.s.next_due_in("A"), 120, delta=1)
+        self.s.record_error("A")
+        self.assertAlmostEqual(self.s.next_due_in("A"), 240, delta=1)
+        for _ in range(10):
+            self.s.record_error("A")
+        self.assertAlmostEqual(self.s.next_due_in("A"), ui.POLL_BACKOFF_MAX_SECONDS, delta=1)
+
+    def test_success_resets_backoff(self):
+        for _ in range(3):
+            self.s.record_error("A")
+        self.s.record_success("A", SEV_OK)
+        self.s.record_error("A")
+        self.assertAlmostEqual(self.s.next_due_in("A"), 120, delta=1)
+
+    def test_hint_is_a_floor(self):
+        # the breaker cooldown reaches the scheduler as a hint on record_error
+        self.s.record_error("A", hint=900)
+        self.assertAlmostEqual(self.s.next_due_in("A"), 900, delta=1)
+        self.s.record_error("B", hint=10)
+        self.assertAlmostEqual(self.s.next_due_in("B"), 120, delta=1)
+
+    def test_hint_is_capped(self):
+        self.s.record_success("A", SEV_OK, hint=10 * ui.POLL_BACKOFF_MAX_SECONDS)
+        self.assertAlmostEqual(self.s.next_due_in("A"), ui.POLL_BACKOFF_MAX_SECONDS, delta=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import contextlib
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import GUI.uiConfig as ui
+from Utility import statusSources
+from Utility.statusPipeline import StatusPipeline
+
+TRIAL = 0.2
+
+
+class BreakerTrialTest(unittest.TestCase):
+    def setUp(self):
+        self.delay = 0.0
+        self.fail = True
+
+        def fetch():
+            time.sleep(self.delay)
+            if self.fail:
+                raise ConnectionError("down")
+            return {"text": "X: Operational", "sev": statusSources.SEV_OK, "url": None, "clickable": False}
+
+        tmp = tempfile.mkdtemp(prefix="ticker-test-")
+        for patcher in (mock.patch.object(statusSources, "FETCHERS", [("X", fetch, ["http://x.invalid/"])]),
+                        mock.patch.object(statusSources, "PROVIDER_NAMES", ["X"]),
+                        mock.patch.object(ui, "BREAKER_TRIAL_SECONDS", TRIAL),
+                        mock.patch.object(ui, "HISTORY_ENABLED", False)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.pipeline = StatusPipeline(["X"], snapshot_path=os.path.join(tmp, "last_status.json"))
+
+    def test_late_trial_success_closes_breaker(self):
+        self.fail = False
+        self.pipeline.refresh()  # a good segment to serve stale
+        self.fail = True
+        for _ in range(ui.BREAKER_FAILURES):
+            with contextlib.suppress(ConnectionError):  # raised until the stale mark changes the ticker
+                self.pipeline.refresh()
+        self.assertTrue(self.pipeline.breakers.is_open("X"))
+
+        # recovered, but slower than the trial allows
+        self.fail, self.delay = False, 3 * TRIAL
+        with self.assertRaises(TimeoutError):
+            self.pipeline.refresh()
+        self.assertTrue(self.pipeline.breakers.is_open("X"))
+        time.sleep(4 * TRIAL)
+
+        report = self.pipeline.refresh([])
+        self.assertIn("X", report["late"])
+        self.assertFalse(self.pipeline.breakers.is_open("X"))
+        self.assertNotIn("stale", report["segments"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
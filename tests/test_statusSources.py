@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+
+import requests
+
+from Utility import htmlExtract, statusSources
+
+SPEC = next(s for s in statusSources.PROVIDERS if s["kind"] == "html")
+PAGE = (b"<html><body><div>All systems operational</div>" + b"<p>filler</p>" * 2000
+        + b"<div role='alert'>Exchange Online: outage in North America</div></body></html>")
+
+
+class _Response:
+    encoding = "utf-8"
+
+    def __init__(self, chunks, fail_after=None):
+        self._chunks = chunks
+        self._fail_after = fail_after
+
+    def iter_content(self, chunk_size=None):
+        for i, chunk in enumerate(self._chunks):
+            if i == self._fail_after:
+                raise requests.exceptions.ChunkedEncodingError("connection reset mid-body")
+            yield chunk
+
+
+def chunked(page: bytes, size: int = 4096):
+    return [page[i:i + size] for i in range(0, len(page), size)]
+
+
+class ParseHtmlTest(unittest.TestCase):
+    def test_whole_page(self):
+        seg = statusSources._parse_html(_Response(chunked(PAGE)), SPEC)
+        self.assertEqual(seg["sev"], statusSources.SEV_OUTAGE)
+
+    def test_mid_body_error_propagates(self):
+        # the outage line is in the part that never arrives: no "Operational" from half a page
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            statusSources._parse_html(_Response(chunked(PAGE), fail_after=1), SPEC)
+
+    def test_tokenizer_failure_refetches_for_full_scrape(self):
+        calls = []
+
+        def download(spec, url, parse):
+            calls.append(parse)
+            r = _Response(chunked(PAGE))
+            r.text = PAGE.decode()
+            return parse(r)
+
+        with mock.patch.object(statusSources, "download", download), \
+                mock.patch.object(htmlExtract.KeywordLineExtractor, "feed", side_effect=AssertionError("bad markup")):
+            seg = statusSources._fetch_html(SPEC)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(seg["sev"], statusSources.SEV_OUTAGE)
+
+
+if __name__ == "__main__":
+    unittest.main()